@@ -2,11 +2,170 @@
 A2A Protocol Configuration for MESH Server
 """
 
-from typing import Dict, List, Any
-from pydantic import BaseModel
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Annotated, Any, ClassVar, FrozenSet, Literal, Mapping, Tuple, Union, get_args
 
-class A2AServerConfig(BaseModel):
+# Pydantic settings applied when a TypeAdapter validates one of the config
+# dataclasses (the stdlib counterpart of a BaseModel's model_config); the
+# defaults are trusted constants, so they are never re-validated, and
+# unknown keys are rejected just as the dataclass constructors reject them
+_PYDANTIC_CONFIG: Mapping[str, Any] = MappingProxyType({"validate_default": False, "extra": "forbid"})
+
+class _TaggedByType:
+    """Annotated marker that validates a Union of capability records as a
+    discriminated union keyed on their ``type`` field
+
+    Implemented as a schema hook rather than a pydantic.Field(discriminator=...)
+    so that importing this module never imports pydantic; the hook only runs
+    when a TypeAdapter is built for one of the config classes.
+    """
+
+    def __get_pydantic_core_schema__(self, source: Any, handler: Any) -> Any:
+        from pydantic_core import core_schema
+        return core_schema.tagged_union_schema(
+            choices={
+                record.__dataclass_fields__["type"].default: handler.generate_schema(record)
+                for record in get_args(source)
+            },
+            discriminator="type"
+        )
+
+# Shared immutable defaults, referenced (never copied) by every model instance
+_MESH = sys.intern("MESH")
+_VERSION = sys.intern("1.0.0")
+_SUPPORTED_METHODS: Tuple[str, ...] = tuple(sys.intern(method) for method in (
+    "initialize",
+    "capabilities", 
+    "methods",
+    "discover_agents",
+    "delegate_task",
+    "collaborate",
+    "get_contact_info",
+    "suggest_email_template",
+    "write_email_draft"
+))
+_ALLOWED_ORIGINS: Tuple[str, ...] = ("*",)
+
+# Capability areas stored as parallel tuples (one entry per area) so bulk
+# method enumeration walks flat tuples; the typed capability records used
+# by AgentCapabilities.capabilities are only built on first use
+_CAP_NAMES: Tuple[str, ...] = (
+    "email_management",
+    "contact_management",
+    "professional_networking",
+    "collaboration"
+)
+_CAP_DESCRIPTIONS: Tuple[str, ...] = (
+    "Create, edit, and manage professional emails",
+    "Access and search professional contact directory",
+    "Facilitate strategic introductions and connections",
+    "Work with other A2A agents for enhanced capabilities"
+)
+_CAP_METHODS: Tuple[Tuple[str, ...], ...] = (
+    ("write_email_draft", "suggest_email_template"),
+    ("get_contact_info", "search_contacts"),
+    ("create_introduction", "suggest_connections"),
+    ("delegate_task", "collaborate", "coordinate_workflow")
+)
+_CAP_DETAILS: Tuple[Mapping[str, Any], ...] = (
+    MappingProxyType({
+        "supported_formats": ("text", "html"),
+        "templates_available": ("introduction", "follow-up", "networking")
+    }),
+    MappingProxyType({
+        "data_sources": ("directory.csv", "external_crm"),
+        "search_capabilities": ("name", "email", "company", "expertise")
+    }),
+    MappingProxyType({
+        "network_analysis": True,
+        "opportunity_matching": True
+    }),
+    MappingProxyType({
+        "agent_discovery": True,
+        "task_orchestration": True
+    })
+)
+_CAP_ALL_METHODS: FrozenSet[str] = frozenset(chain.from_iterable(_CAP_METHODS))
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class EmailManagementCap:
+    """Email management capability area"""
+    __pydantic_config__ = _PYDANTIC_CONFIG
+    type: Literal["email_management"] = "email_management"
+    description: str
+    methods: Tuple[str, ...]
+    supported_formats: Tuple[str, ...]
+    templates_available: Tuple[str, ...]
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ContactManagementCap:
+    """Contact management capability area"""
+    __pydantic_config__ = _PYDANTIC_CONFIG
+    type: Literal["contact_management"] = "contact_management"
+    description: str
+    methods: Tuple[str, ...]
+    data_sources: Tuple[str, ...]
+    search_capabilities: Tuple[str, ...]
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ProfessionalNetworkingCap:
+    """Professional networking capability area"""
+    __pydantic_config__ = _PYDANTIC_CONFIG
+    type: Literal["professional_networking"] = "professional_networking"
+    description: str
+    methods: Tuple[str, ...]
+    network_analysis: bool
+    opportunity_matching: bool
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CollaborationCap:
+    """Multi-agent collaboration capability area"""
+    __pydantic_config__ = _PYDANTIC_CONFIG
+    type: Literal["collaboration"] = "collaboration"
+    description: str
+    methods: Tuple[str, ...]
+    agent_discovery: bool
+    task_orchestration: bool
+
+# Any capability record, discriminated by its "type" tag
+Capability = Annotated[
+    Union[EmailManagementCap, ContactManagementCap, ProfessionalNetworkingCap, CollaborationCap],
+    _TaggedByType()
+]
+_CAP_RECORD_TYPES = (EmailManagementCap, ContactManagementCap, ProfessionalNetworkingCap, CollaborationCap)
+
+@lru_cache(maxsize=None)
+def _default_capabilities() -> Tuple[Capability, ...]:
+    """Build the capability records from the parallel tuples"""
+    return tuple(
+        record_type(description=description, methods=methods, **details)
+        for record_type, description, methods, details in zip(_CAP_RECORD_TYPES, _CAP_DESCRIPTIONS, _CAP_METHODS, _CAP_DETAILS)
+    )
+
+_COMMUNICATION_PROTOCOLS: Tuple[str, ...] = ("A2A", "MCP")
+_SUPPORTED_TRANSPORTS: Tuple[str, ...] = ("HTTP", "WebSocket", "STDIO")
+
+@dataclass(frozen=True, slots=True)
+class PerformanceMetrics:
+    """Advertised agent performance characteristics"""
+    __pydantic_config__ = _PYDANTIC_CONFIG
+    response_time_ms: int = 500
+    throughput_requests_per_second: int = 100
+    concurrent_connections: int = 50
+    memory_usage_mb: int = 128
+
+_SUPPORTED_CONTENT_TYPES: Tuple[str, ...] = ("text/plain", "application/json", "text/markdown")
+_PRIORITY_LEVELS: Tuple[str, ...] = ("low", "normal", "high", "urgent")
+
+@dataclass(frozen=True, slots=True)
+class A2AServerConfig:
     """Configuration for the A2A server"""
+    __pydantic_config__ = _PYDANTIC_CONFIG
+    
     host: str = "127.0.0.1"
     port: int = 8080
     debug: bool = True
@@ -14,27 +173,21 @@ class A2AServerConfig(BaseModel):
     
     # A2A Protocol settings
     protocol_version: str = "2024-11-05"
-    agent_name: str = "MESH"
-    agent_version: str = "1.0.0"
+    agent_name: str = _MESH
+    agent_version: str = _VERSION
     agent_description: str = "Model Exchange Server Handler with A2A Integration"
     
     # Agent capabilities
-    supported_methods: List[str] = [
-        "initialize",
-        "capabilities", 
-        "methods",
-        "discover_agents",
-        "delegate_task",
-        "collaborate",
-        "get_contact_info",
-        "suggest_email_template",
-        "write_email_draft"
-    ]
+    # Tuples keep the advertised order; use the *_SET variants for membership tests
+    supported_methods: Tuple[str, ...] = _SUPPORTED_METHODS
+    SUPPORTED_METHODS_COUNT: ClassVar[int] = len(_SUPPORTED_METHODS)
+    SUPPORTED_METHODS_SET: ClassVar[FrozenSet[str]] = frozenset(_SUPPORTED_METHODS)
     
     # Communication settings
     max_message_size: int = 1024 * 1024  # 1MB
     timeout_seconds: int = 30
     retry_attempts: int = 3
+    simulate_latency: bool = False  # add demo delays to the mock handlers
     
     # Discovery settings
     discovery_enabled: bool = True
@@ -44,91 +197,126 @@ class A2AServerConfig(BaseModel):
     # Security settings
     enable_auth: bool = False
     api_key_required: bool = False
-    allowed_origins: List[str] = ["*"]
+    allowed_origins: Tuple[str, ...] = _ALLOWED_ORIGINS
 
-class AgentCapabilities(BaseModel):
+@dataclass(frozen=True, slots=True)
+class AgentCapabilities:
     """MESH agent capabilities definition"""
-    name: str = "MESH"
-    version: str = "1.0.0"
+    __pydantic_config__ = _PYDANTIC_CONFIG
+    
+    name: str = _MESH
+    version: str = _VERSION
     description: str = "Professional email management and networking assistant"
     
-    capabilities: Dict[str, Any] = {
-        "email_management": {
-            "description": "Create, edit, and manage professional emails",
-            "methods": ["write_email_draft", "suggest_email_template"],
-            "supported_formats": ["text", "html"],
-            "templates_available": ["introduction", "follow-up", "networking"]
-        },
-        "contact_management": {
-            "description": "Access and search professional contact directory",
-            "methods": ["get_contact_info", "search_contacts"],
-            "data_sources": ["directory.csv", "external_crm"],
-            "search_capabilities": ["name", "email", "company", "expertise"]
-        },
-        "professional_networking": {
-            "description": "Facilitate strategic introductions and connections",
-            "methods": ["create_introduction", "suggest_connections"],
-            "network_analysis": True,
-            "opportunity_matching": True
-        },
-        "collaboration": {
-            "description": "Work with other A2A agents for enhanced capabilities",
-            "methods": ["delegate_task", "collaborate", "coordinate_workflow"],
-            "agent_discovery": True,
-            "task_orchestration": True
-        }
-    }
+    capabilities: Tuple[Capability, ...] = field(default_factory=_default_capabilities)
+    CAPABILITY_COUNT: ClassVar[int] = len(_CAP_NAMES)
+    
+    communication_protocols: Tuple[str, ...] = _COMMUNICATION_PROTOCOLS
+    supported_transports: Tuple[str, ...] = _SUPPORTED_TRANSPORTS
     
-    communication_protocols: List[str] = ["A2A", "MCP"]
-    supported_transports: List[str] = ["HTTP", "WebSocket", "STDIO"]
+    performance_metrics: PerformanceMetrics = PerformanceMetrics()
     
-    performance_metrics: Dict[str, Any] = {
-        "response_time_ms": 500,
-        "throughput_requests_per_second": 100,
-        "concurrent_connections": 50,
-        "memory_usage_mb": 128
-    }
-
-class A2AMessageConfig(BaseModel):
+    def all_methods(self) -> FrozenSet[str]:
+        """Get the method names offered across all capability areas"""
+        if self.capabilities is _default_capabilities():
+            return _CAP_ALL_METHODS
+        return frozenset(chain.from_iterable(cap.methods for cap in self.capabilities))
+
+@dataclass(frozen=True, slots=True)
+class A2AMessageConfig:
     """A2A message configuration"""
+    __pydantic_config__ = _PYDANTIC_CONFIG
+    
     max_message_length: int = 10000
-    supported_content_types: List[str] = ["text/plain", "application/json", "text/markdown"]
+    supported_content_types: Tuple[str, ...] = _SUPPORTED_CONTENT_TYPES
+    SUPPORTED_CONTENT_TYPES_SET: ClassVar[FrozenSet[str]] = frozenset(_SUPPORTED_CONTENT_TYPES)
     compression_enabled: bool = True
     encryption_enabled: bool = False
     
     # Message routing
     routing_strategy: str = "direct"  # direct, broadcast, multicast
-    priority_levels: List[str] = ["low", "normal", "high", "urgent"]
+    priority_levels: Tuple[str, ...] = _PRIORITY_LEVELS
+    PRIORITY_LEVELS_SET: ClassVar[FrozenSet[str]] = frozenset(_PRIORITY_LEVELS)
     
     # Error handling
     retry_on_failure: bool = True
     max_retry_attempts: int = 3
     backoff_strategy: str = "exponential"  # linear, exponential, fixed
 
-# Default configuration instances
-default_server_config = A2AServerConfig()
-default_agent_capabilities = AgentCapabilities()
-default_message_config = A2AMessageConfig()
+# Default configuration instances, constructed once and reused
+@lru_cache(maxsize=None)
+def get_server_config() -> A2AServerConfig:
+    """Get the shared default A2A server configuration"""
+    return A2AServerConfig()
+
+@lru_cache(maxsize=None)
+def get_agent_capabilities() -> AgentCapabilities:
+    """Get the shared default agent capabilities"""
+    return AgentCapabilities()
+
+@lru_cache(maxsize=None)
+def get_message_config() -> A2AMessageConfig:
+    """Get the shared default A2A message configuration"""
+    return A2AMessageConfig()
+
+# JSON serialization, reusing one pydantic TypeAdapter per config class;
+# the defaults are immutable, so each payload is encoded once per process
+@lru_cache(maxsize=None)
+def _type_adapter(config_type: type) -> Any:
+    """Build (once) the TypeAdapter used to serialize a config class"""
+    from pydantic import TypeAdapter
+    return TypeAdapter(config_type)
+
+@lru_cache(maxsize=None)
+def dump_server_config_json() -> bytes:
+    """Serialize the default A2A server configuration to JSON"""
+    return _type_adapter(A2AServerConfig).dump_json(get_server_config())
+
+@lru_cache(maxsize=None)
+def dump_agent_capabilities_json() -> bytes:
+    """Serialize the default agent capabilities to JSON"""
+    return _type_adapter(AgentCapabilities).dump_json(get_agent_capabilities())
+
+@lru_cache(maxsize=None)
+def dump_message_config_json() -> bytes:
+    """Serialize the default A2A message configuration to JSON"""
+    return _type_adapter(A2AMessageConfig).dump_json(get_message_config())
+
+# Backward-compatible module attributes, resolved lazily (PEP 562)
+_DEFAULT_ACCESSORS = {
+    "default_server_config": get_server_config,
+    "default_agent_capabilities": get_agent_capabilities,
+    "default_message_config": get_message_config,
+}
+
+def __getattr__(name: str) -> Any:
+    """Forward the legacy default_* attributes to their cached accessors"""
+    accessor = _DEFAULT_ACCESSORS.get(name)
+    if accessor is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    instance = globals()[name] = accessor()
+    return instance
 
 # Configuration validation
 def validate_config() -> bool:
     """Validate the A2A configuration"""
-    try:
-        # Validate server config
-        server_config = A2AServerConfig()
-        
-        # Validate agent capabilities
-        agent_caps = AgentCapabilities()
-        
-        # Validate message config
-        msg_config = A2AMessageConfig()
-        
-        print("✅ A2A configuration validation passed")
-        return True
-        
-    except Exception as e:
-        print(f"❌ A2A configuration validation failed: {e}")
-        return False
+    # The defaults are constants, so building them cannot fail at runtime;
+    # the check is skipped entirely under python -O
+    if __debug__:
+        get_server_config()
+        get_agent_capabilities()
+        get_message_config()
+    return True
+
+def report_config() -> None:
+    """Print a summary of the default A2A configuration"""
+    server_config = get_server_config()
+    agent_capabilities = get_agent_capabilities()
+    print("\nConfiguration Summary:")
+    print(f"Server: {server_config.host}:{server_config.port}")
+    print(f"Agent: {agent_capabilities.name} v{agent_capabilities.version}")
+    print(f"Methods: {A2AServerConfig.SUPPORTED_METHODS_COUNT} supported")
+    print(f"Capabilities: {AgentCapabilities.CAPABILITY_COUNT} areas")
 
 if __name__ == "__main__":
     print("A2A Configuration Module")
@@ -136,10 +324,7 @@ if __name__ == "__main__":
     
     # Validate configuration
     if validate_config():
-        print("\nConfiguration Summary:")
-        print(f"Server: {default_server_config.host}:{default_server_config.port}")
-        print(f"Agent: {default_agent_capabilities.name} v{default_agent_capabilities.version}")
-        print(f"Methods: {len(default_server_config.supported_methods)} supported")
-        print(f"Capabilities: {len(default_agent_capabilities.capabilities)} areas")
+        print("✅ A2A configuration validation passed")
+        report_config()
     else:
         print("Configuration validation failed!")
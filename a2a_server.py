@@ -4,16 +4,25 @@ Implements A2A protocol alongside existing MCP functionality
 """
 
 import asyncio
-import json
+import itertools
 import logging
+import re
+import secrets
 import time
-from typing import Dict, List, Any, Optional
+import traceback
+import uuid
+import weakref
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from datetime import datetime
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+import orjson
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
-from a2a_config import default_server_config
+from a2a_config import get_server_config
 from agent_capabilities import mesh_capabilities
 from agent_manager import agent_manager
 from task_orchestrator import task_orchestrator
@@ -21,6 +30,137 @@ from task_orchestrator import task_orchestrator
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+logger.setLevel(get_server_config().log_level.upper())
+
+# JSON-RPC error for requests that are not a valid request object
+_INVALID_REQUEST = {"code": -32600, "message": "Invalid Request", "data": None}
+
+# JSON-RPC error for params that do not have the expected shape
+_INVALID_PARAMS = {"code": -32602, "message": "Invalid params", "data": None}
+
+# How long the cached /health timestamp and body stay valid
+TIMESTAMP_TTL_SECONDS = 1.0
+
+# Discovery documents are static, so let clients and proxies cache them
+DISCOVERY_CACHE_HEADERS = {"Cache-Control": "public, max-age=300"}
+
+# Email templates offered by suggest_email_template, keyed by context keyword
+_EMAIL_TEMPLATES = {
+    "introduction": {
+        "template": "email-examples://3-way-intro",
+        "description": "Professional 3-way introduction template",
+        "best_for": "Connecting two people who could benefit from knowing each other"
+    },
+    "follow-up": {
+        "template": "email-examples://call-follow-up",
+        "description": "Call follow-up template with action items",
+        "best_for": "Following up after meetings or calls"
+    }
+}
+_EMAIL_TEMPLATE_NAMES = tuple(_EMAIL_TEMPLATES)
+_EMAIL_TEMPLATE_MATCHER = re.compile("|".join(map(re.escape, _EMAIL_TEMPLATES)))
+
+# Canned replies for message/send, routed by topic keywords
+_EMAIL_TEMPLATE_REPLY = "I can help you with email templates! I offer several professional templates:\n\n1. **Follow-up Template** - For post-meeting follow-ups\n2. **Networking Template** - For building professional connections\n3. **Introduction Template** - For 3-way introductions\n4. **Thank You Template** - For post-interview follow-ups\n\nWould you like me to generate a specific template for you?"
+_EMAIL_PROFESSIONAL_REPLY = "I specialize in creating professional emails! I can help you with:\n\n• Business follow-ups\n• Networking outreach\n• Professional introductions\n• Thank you notes\n• Meeting confirmations\n\nJust let me know what type of email you need and I'll craft it for you."
+_EMAIL_REPLY = "I'm your email composition assistant! I can help you create professional emails, suggest templates, and manage your email communications. What type of email would you like help with?"
+_CONTACT_REPLY = "I can help you search and manage your contact database! I can:\n\n• Search for contacts by name, company, or industry\n• Provide contact details and relationship history\n• Suggest networking opportunities\n• Help organize your professional network\n\nWhat contact information are you looking for?"
+_INTRODUCTION_REPLY = "I'm excellent at 3-way introductions! This involves connecting two people through a mutual contact. I can help you:\n\n• Identify potential connections\n• Craft introduction messages\n• Follow up on introductions\n• Build your professional network strategically\n\nWould you like me to help you set up a 3-way introduction?"
+_NETWORKING_REPLY = "I can help you build and manage your professional network! I offer:\n\n• Strategic networking strategies\n• Introduction management\n• Follow-up planning\n• Relationship tracking\n• Networking opportunity identification\n\nWhat networking goal would you like to work on?"
+_COLLABORATION_REPLY = "I'm designed for multi-agent collaboration! I can:\n\n• Coordinate with other AI agents\n• Execute complex workflows\n• Delegate tasks to specialized agents\n• Manage multi-step processes\n• Orchestrate team efforts\n\nWhat kind of collaboration or workflow would you like to explore?"
+_GENERAL_REPLY = "I'm MESH, your professional email management and networking assistant! Here's what I can do:\n\n📧 **Email Management**\n• Compose professional emails\n• Generate email templates\n• Manage follow-ups\n\n👥 **Contact Management**\n• Search contact database\n• Track relationships\n• Organize network\n\n🤝 **Professional Networking**\n• Strategic networking\n• 3-way introductions\n• Relationship building\n\n🔄 **Multi-Agent Collaboration**\n• Workflow orchestration\n• Task delegation\n• Team coordination\n\nHow can I help you today?"
+
+def _email_reply(message_lower: str) -> str:
+    """Pick the email-related reply"""
+    if "template" in message_lower:
+        return _EMAIL_TEMPLATE_REPLY
+    elif "professional" in message_lower:
+        return _EMAIL_PROFESSIONAL_REPLY
+    return _EMAIL_REPLY
+
+def _networking_reply(message_lower: str) -> str:
+    """Pick the networking-related reply"""
+    if "3-way" in message_lower or "introduction" in message_lower:
+        return _INTRODUCTION_REPLY
+    return _NETWORKING_REPLY
+
+# (topic keywords, reply picker) in priority order; keywords match anywhere in the text
+_INTENT_ROUTES = (
+    (("email", "draft", "compose", "write"), _email_reply),
+    (("contact", "database", "search", "find"), lambda message_lower: _CONTACT_REPLY),
+    (("network", "introduction", "connect", "relationship"), _networking_reply),
+    (("collaborate", "workflow", "agent", "coordinate"), lambda message_lower: _COLLABORATION_REPLY),
+    (("help", "what can you do", "capabilities", "skills"), lambda message_lower: _GENERAL_REPLY),
+)
+# One lookahead per position with a capture group per topic, so a single scan
+# reports every keyword occurrence (overlapping ones included) with its topic
+_INTENT_MATCHER = re.compile("(?=" + "|".join(
+    "(" + "|".join(map(re.escape, keywords)) + ")" for keywords, _ in _INTENT_ROUTES
+) + ")")
+
+def _match_intent(message_lower: str) -> Optional[int]:
+    """Return the index of the highest-priority topic mentioned in the text"""
+    best = None
+    for match in _INTENT_MATCHER.finditer(message_lower):
+        topic = match.lastindex - 1
+        if best is None or topic < best:
+            best = topic
+            if topic == 0:
+                break
+    return best
+
+def _intent_reply(message_lower: str) -> Optional[str]:
+    """Return the canned reply for the topic the text mentions, if any"""
+    topic = _match_intent(message_lower)
+    if topic is None:
+        return None
+    return _INTENT_ROUTES[topic][1](message_lower)
+
+# Repeated chat messages reuse their reply; longer texts bypass the cache so
+# it can't pin large request bodies in memory
+INTENT_CACHE_SIZE = 2048
+INTENT_CACHE_MAX_CHARS = 512
+
+@lru_cache(maxsize=INTENT_CACHE_SIZE)
+def _cached_intent_reply(message_key: str) -> Optional[str]:
+    """_intent_reply memoized on the normalized message text"""
+    return _intent_reply(message_key)
+
+# Constant results of the direct (root endpoint) introspection methods
+_DIRECT_INITIALIZE_RESULT = {
+    "status": "success",
+    "agent_info": {
+        "name": "mesh_agent",
+        "version": "1.0.0",
+        "capabilities": ["email_management", "contact_management", "professional_networking", "collaboration"]
+    }
+}
+_DIRECT_CAPABILITIES_RESULT = {
+    "capabilities": {
+        "streaming": False,
+        "collaboration": True,
+        "workflow": True
+    },
+    "skills": [
+        "email_management",
+        "contact_management",
+        "professional_networking",
+        "agent_collaboration"
+    ]
+}
+_DIRECT_METHODS_RESULT = {
+    "methods": [
+        "initialize",
+        "capabilities",
+        "methods",
+        "write_email_draft",
+        "get_contact_info",
+        "suggest_email_template",
+        "discover_agents",
+        "delegate_task",
+        "collaborate"
+    ]
+}
 
 # A2A Protocol Models
 class A2ARequest(BaseModel):
@@ -43,6 +183,40 @@ class A2AError(BaseModel):
     message: str
     data: Optional[Dict[str, Any]] = None
 
+def _orjson_default(obj: Any) -> Any:
+    """Serialize the Pydantic models orjson does not handle natively"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+async def _read_json(request: Request) -> Dict[str, Any]:
+    """Decode a JSON object request body without FastAPI body validation"""
+    # Refuse oversized bodies before reading or parsing them on the event loop
+    max_size = get_server_config().max_message_size
+    try:
+        declared_size = int(request.headers.get("content-length") or 0)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid Content-Length header")
+    if declared_size > max_size:
+        raise HTTPException(status_code=413, detail="Request body too large")
+    body = await request.body()
+    if len(body) > max_size:
+        raise HTTPException(status_code=413, detail="Request body too large")
+    
+    try:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=400, detail="Request body must be a JSON object")
+    return data
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
 class A2AServer:
     """A2A Protocol Server Implementation"""
     
@@ -50,7 +224,8 @@ class A2AServer:
         self.app = FastAPI(
             title="MESH A2A Server",
             description="A2A Protocol Server for MESH Integration",
-            version="1.0.0"
+            version="1.0.0",
+            default_response_class=ORJSONResponse
         )
         
         # Configure CORS
@@ -66,8 +241,62 @@ class A2AServer:
         self._register_routes()
         
         # Server state
-        self.connected_clients: List[WebSocket] = []
+        self.connected_clients: "weakref.WeakSet[WebSocket]" = weakref.WeakSet()
         self.server_start_time = datetime.now()
+        self._server_start_monotonic = time.monotonic()
+        
+        # The /health timestamp is cached for TIMESTAMP_TTL_SECONDS
+        self._timestamp_refreshed_at = float("-inf")
+        self._timestamp_iso = ""
+        self._health_cached = ("", b"")
+        
+        # Mock handlers only sleep when latency simulation is configured
+        self._simulate_latency = get_server_config().simulate_latency
+        
+        # Draft IDs: a per-process random prefix plus a running counter
+        self._draft_prefix = secrets.token_hex(4)
+        self._draft_seq = itertools.count(1)
+        
+        # A2A method name -> bound handler
+        # Handlers that never await are kept apart and called without a coroutine
+        self._sync_method_dispatch = {
+            "initialize": self._handle_initialize,
+            "capabilities": self._handle_capabilities,
+            "methods": self._handle_methods
+        }
+        self._method_dispatch = {
+            "discover_agents": self._handle_discover_agents,
+            "delegate_task": self._handle_delegate_task,
+            "collaborate": self._handle_collaborate,
+            "get_contact_info": self._handle_get_contact_info,
+            "suggest_email_template": self._handle_suggest_email_template,
+            "write_email_draft": self._handle_write_email_draft
+        }
+        
+        # Direct (root endpoint) method name -> bound handler
+        self._direct_method_dispatch = {
+            "initialize": self._rpc_initialize,
+            "capabilities": self._rpc_capabilities,
+            "methods": self._rpc_methods,
+            "write_email_draft": self._rpc_write_email_draft,
+            "get_contact_info": self._rpc_get_contact_info,
+            "message/send": self._rpc_message_send
+        }
+        
+        # Capability, method and template listings are fixed once loaded
+        self._capabilities_result = self._build_capabilities_result()
+        self._methods_result = self._build_methods_result()
+        self._static_result_bytes = {
+            "capabilities": orjson.dumps(self._capabilities_result),
+            "methods": orjson.dumps(self._methods_result)
+        }
+        self._workflows_bytes = orjson.dumps({"templates": task_orchestrator.get_templates()})
+        
+        # Discovery documents never change at runtime, so serialize them once
+        self._base_url = f"http://{get_server_config().host}:{get_server_config().port}"
+        self._agent_card_bytes = orjson.dumps(self._build_agent_card())
+        self._ai_plugin_bytes = orjson.dumps(self._build_ai_plugin())
+        self._openapi_bytes = orjson.dumps(self._build_openapi_schema())
         
         logger.info("A2A Server initialized")
     
@@ -82,31 +311,41 @@ class A2AServer:
                 "version": "1.0.0",
                 "protocol": "A2A",
                 "status": "running",
-                "uptime": (datetime.now() - self.server_start_time).total_seconds()
+                "uptime": time.monotonic() - self._server_start_monotonic
             }
         
         @self.app.get("/health")
         async def health_check():
             """Health check endpoint"""
-            return {
-                "status": "healthy",
-                "timestamp": datetime.now().isoformat(),
-                "agent_manager": "running",
-                "task_orchestrator": "running"
-            }
+            timestamp = self._health_timestamp()
+            if self._health_cached[0] is not timestamp:
+                self._health_cached = (timestamp, orjson.dumps({
+                    "status": "healthy",
+                    "timestamp": timestamp,
+                    "agent_manager": "running",
+                    "task_orchestrator": "running"
+                }))
+            return Response(content=self._health_cached[1], media_type="application/json")
         
         @self.app.post("/a2a")
-        async def a2a_endpoint(request: A2ARequest):
+        async def a2a_endpoint(request: Request):
             """Main A2A protocol endpoint"""
+            data = await _read_json(request)
+            error = self._request_error(data)
+            if error is not None:
+                return {"jsonrpc": "2.0", "id": data.get("id"), "error": error}
+            # Static listings are written straight from their encoded bytes
+            static = self._static_result_bytes.get(data["method"])
+            if static is not None:
+                return Response(content=static, media_type="application/json")
             try:
-                logger.info(f"Handling A2A request: {request.method}")
-                result = await self._handle_a2a_request(request)
+                result = await self._handle_a2a_request(data["method"], data.get("params") or {})
                 return result
             except Exception as e:
                 logger.error(f"Error handling A2A request: {e}")
                 return {
                     "jsonrpc": "2.0",
-                    "id": request.id,
+                    "id": data.get("id"),
                     "error": {
                         "code": -32603,
                         "message": "Internal error",
@@ -115,36 +354,25 @@ class A2AServer:
                 }
                
         @self.app.post("/")
-        async def a2a_protocol_root(request: dict):
+        async def a2a_protocol_root(raw_request: Request):
             """A2A protocol root endpoint for compatibility"""
+            request = await _read_json(raw_request)
             try:
                 # Log incoming request for debugging
-                logger.info(f"🔍 Incoming request to root endpoint: {request.get('method', 'NO_METHOD')}")
-                logger.info(f"🔍 Request ID: {request.get('id', 'NO_ID')}")
-                logger.info(f"🔍 Request params: {request.get('params', {})}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("🔍 Incoming request to root endpoint: %s", request.get('method', 'NO_METHOD'))
+                    logger.debug("🔍 Request ID: %s", request.get('id', 'NO_ID'))
+                    logger.debug("🔍 Request params: %s", request.get('params', {}))
                 
-                # Handle both A2A protocol and direct method calls
-                if "method" in request:
-                    # Use the new direct method handler for A2A Inspector compatibility
-                    logger.info(f"🔍 Calling _handle_direct_method for method: {request['method']}")
-                    result = await self._handle_direct_method(request)
-                    logger.info(f"🔍 _handle_direct_method returned: {result}")
-                    # Return raw response to bypass FastAPI validation
-                    from fastapi.responses import JSONResponse
-                    return JSONResponse(content=result)
-                else:
-                    # Direct method call
-                    logger.info(f"🔍 No method found, calling _handle_direct_method anyway")
-                    result = await self._handle_direct_method(request)
-                    logger.info(f"🔍 _handle_direct_method returned: {result}")
-                    # Return raw response to bypass FastAPI validation
-                    from fastapi.responses import JSONResponse
-                    return JSONResponse(content=result)
+                # A2A protocol requests and bare direct calls share one handler
+                result = await self._handle_direct_method(request)
+                logger.debug("🔍 _handle_direct_method returned: %s", result)
+                # Return raw response to bypass FastAPI validation
+                return ORJSONResponse(content=result)
             except Exception as e:
-                logger.error(f"❌ Error handling A2A protocol request: {e}")
-                logger.error(f"❌ Exception type: {type(e).__name__}")
-                import traceback
-                logger.error(f"❌ Full traceback: {traceback.format_exc()}")
+                logger.error(f"❌ Error handling A2A protocol request: {type(e).__name__}: {e}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("❌ Full traceback: %s", traceback.format_exc())
                 error_response = {
                     "jsonrpc": "2.0",
                     "id": request.get("id", "unknown"),
@@ -154,39 +382,47 @@ class A2AServer:
                         "data": str(e)
                     }
                 }
-                from fastapi.responses import JSONResponse
-                return JSONResponse(content=error_response)
+                return ORJSONResponse(content=error_response)
         
         @self.app.websocket("/ws")
         async def websocket_endpoint(websocket: WebSocket):
             """WebSocket endpoint for real-time A2A communication"""
             await websocket.accept()
-            self.connected_clients.append(websocket)
+            self.connected_clients.add(websocket)
             
             try:
                 while True:
                     # Receive message
                     data = await websocket.receive_text()
-                    request_data = json.loads(data)
-                    request = A2ARequest(**request_data)
+                    if len(data.encode()) > get_server_config().max_message_size:
+                        # 1009: message too big to process
+                        await websocket.close(code=1009)
+                        self.connected_clients.discard(websocket)
+                        break
+                    try:
+                        request_data = orjson.loads(data)
+                    except orjson.JSONDecodeError as e:
+                        await websocket.send_text(orjson.dumps({
+                            "jsonrpc": "2.0",
+                            "id": None,
+                            "error": {"code": -32700, "message": "Parse error", "data": str(e)}
+                        }).decode())
+                        continue
                     
-                    # Handle request
-                    result = await self._handle_a2a_request(request)
+                    # A JSON-RPC batch is dispatched concurrently and answered in one frame
+                    if isinstance(request_data, list):
+                        await websocket.send_text((await self._handle_batch(request_data)).decode())
+                        continue
                     
-                    # Send response
-                    response = A2AResponse(
-                        id=request.id,
-                        result=result
-                    )
-                    await websocket.send_text(response.json())
+                    # Handle request and send response
+                    await websocket.send_text((await self._handle_ws_call(request_data)).decode())
                     
             except WebSocketDisconnect:
-                self.connected_clients.remove(websocket)
+                self.connected_clients.discard(websocket)
                 logger.info("WebSocket client disconnected")
             except Exception as e:
                 logger.error(f"WebSocket error: {e}")
-                if websocket in self.connected_clients:
-                    self.connected_clients.remove(websocket)
+                self.connected_clients.discard(websocket)
         
         @self.app.get("/agents")
         async def list_agents():
@@ -209,8 +445,9 @@ class A2AServer:
                 raise HTTPException(status_code=500, detail=str(e))
         
         @self.app.post("/delegate")
-        async def delegate_task(request: Dict[str, Any]):
+        async def delegate_task(raw_request: Request):
             """Delegate a task to an agent"""
+            request = await _read_json(raw_request)
             try:
                 result = await agent_manager.delegate_task(
                     task_type=request.get("task_type"),
@@ -223,8 +460,9 @@ class A2AServer:
                 raise HTTPException(status_code=500, detail=str(e))
         
         @self.app.post("/collaborate")
-        async def collaborate(request: Dict[str, Any]):
+        async def collaborate(raw_request: Request):
             """Initiate collaboration with an agent"""
+            request = await _read_json(raw_request)
             try:
                 result = await agent_manager.collaborate(
                     collaboration_type=request.get("collaboration_type"),
@@ -239,15 +477,12 @@ class A2AServer:
         @self.app.get("/workflows")
         async def list_workflows():
             """List available workflow templates"""
-            try:
-                templates = task_orchestrator.get_templates()
-                return {"templates": templates}
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=str(e))
+            return Response(content=self._workflows_bytes, media_type="application/json")
         
         @self.app.post("/workflows")
-        async def create_workflow(request: Dict[str, Any]):
+        async def create_workflow(raw_request: Request):
             """Create a new workflow"""
+            request = await _read_json(raw_request)
             try:
                 workflow_id = await task_orchestrator.create_workflow(
                     template_name=request.get("template_name"),
@@ -280,236 +515,269 @@ class A2AServer:
         @self.app.get("/.well-known/agent-card.json")
         async def get_agent_card():
             """Get agent card for A2A Inspector discovery"""
-            try:
-                from agent_capabilities import mesh_capabilities
-                
-                agent_card = {
-                    "name": "mesh_agent",
-                    "version": "1.0.0",
-                    "description": "Professional email management and networking assistant with multi-agent collaboration capabilities.",
-                    "url": f"http://{default_server_config.host}:{default_server_config.port}/",
-                    "protocolVersion": "0.3.0",
-                    "preferredTransport": "JSONRPC",
-                    "capabilities": {
-                        "streaming": False,
-                        "collaboration": True,
-                        "workflow": True
-                    },
-                    "defaultInputModes": [
-                        "text",
-                        "text/plain",
-                        "application/json"
-                    ],
-                    "defaultOutputModes": [
-                        "text",
-                        "text/plain",
-                        "application/json"
-                    ],
-                    "skills": [
-                        {
-                            "id": "email_management",
-                            "name": "Email Composition & Management",
-                            "description": "Create professional emails and manage email templates",
-                            "examples": [
-                                "Write a professional follow-up email",
-                                "Generate an email template for networking"
-                            ],
-                            "tags": [
-                                "email",
-                                "composition",
-                                "templates",
-                                "professional"
-                            ]
-                        },
-                        {
-                            "id": "contact_management",
-                            "name": "Contact Database Operations",
-                            "description": "Search and retrieve contact information from database",
-                            "examples": [
-                                "Find contact information for John Smith",
-                                "Search for contacts in the tech industry"
-                            ],
-                            "tags": [
-                                "contacts",
-                                "database",
-                                "search",
-                                "relationships"
-                            ]
-                        },
-                        {
-                            "id": "professional_networking",
-                            "name": "Strategic Networking",
-                            "description": "Build professional relationships and networking strategies",
-                            "examples": [
-                                "Create a 3-way introduction strategy",
-                                "Develop networking follow-up plan"
-                            ],
-                            "tags": [
-                                "networking",
-                                "relationships",
-                                "strategy",
-                                "professional"
-                            ]
-                        },
-                        {
-                            "id": "agent_collaboration",
-                            "name": "Multi-Agent Collaboration",
-                            "description": "Coordinate with other AI agents for complex workflows",
-                            "examples": [
-                                "Delegate email writing to specialized agent",
-                                "Collaborate with multiple agents for project"
-                            ],
-                            "tags": [
-                                "collaboration",
-                                "workflow",
-                                "orchestration",
-                                "multi-agent"
-                            ]
-                        }
-                    ]
-                }
-                
-                return agent_card
-                
-            except Exception as e:
-                logger.error(f"Error generating agent card: {e}")
-                raise HTTPException(status_code=500, detail=str(e))
+            return Response(
+                content=self._agent_card_bytes,
+                media_type="application/json",
+                headers=DISCOVERY_CACHE_HEADERS
+            )
                
         @self.app.get("/.well-known/ai-plugin.json")
         async def get_ai_plugin():
             """Get AI plugin manifest for compatibility"""
-            try:
-                from agent_capabilities import mesh_capabilities
-                
-                ai_plugin = {
-                    "schema_version": "v1",
-                    "name_for_model": "MESH A2A Agent",
-                    "name_for_human": "MESH - Professional Email & Networking Assistant",
-                    "description_for_model": "MESH is a professional email management and networking assistant that can collaborate with other AI agents to provide enhanced capabilities.",
-                    "description_for_human": "Professional email management, contact management, and networking with multi-agent collaboration capabilities.",
-                    "auth": {
-                        "type": "none"
-                    },
-                    "api": {
-                        "type": "openapi",
-                        "url": f"http://{default_server_config.host}:{default_server_config.port}/openapi.json"
-                    },
-                    "logo_url": "https://github.com/vishalm/agentic-protocol-demos/raw/main/resources/MESH-I-1.png",
-                    "contact_email": "vishal.mishra@example.com",
-                    "legal_info_url": "https://github.com/vishalm/agentic-protocol-demos/blob/main/LICENSE"
-                }
-                
-                return ai_plugin
-                
-            except Exception as e:
-                logger.error(f"Error generating AI plugin manifest: {e}")
-                raise HTTPException(status_code=500, detail=str(e))
+            return Response(
+                content=self._ai_plugin_bytes,
+                media_type="application/json",
+                headers=DISCOVERY_CACHE_HEADERS
+            )
                
         @self.app.get("/openapi.json")
         async def get_openapi_schema():
             """Get OpenAPI schema for the A2A server"""
-            try:
-                # Return a simplified OpenAPI schema for A2A Inspector
-                openapi_schema = {
-                    "openapi": "3.0.0",
-                    "info": {
-                        "title": "MESH A2A Server",
-                        "version": "1.0.0",
-                        "description": "A2A Protocol Server for MESH Integration"
-                    },
-                    "servers": [
-                        {
-                            "url": f"http://{default_server_config.host}:{default_server_config.port}",
-                            "description": "MESH A2A Server"
-                        }
+            return Response(
+                content=self._openapi_bytes,
+                media_type="application/json",
+                headers=DISCOVERY_CACHE_HEADERS
+            )
+    
+    def _build_agent_card(self) -> Dict[str, Any]:
+        """Build the agent card for A2A Inspector discovery"""
+        return {
+            "name": "mesh_agent",
+            "version": "1.0.0",
+            "description": "Professional email management and networking assistant with multi-agent collaboration capabilities.",
+            "url": f"{self._base_url}/",
+            "protocolVersion": "0.3.0",
+            "preferredTransport": "JSONRPC",
+            "capabilities": {
+                "streaming": False,
+                "collaboration": True,
+                "workflow": True
+            },
+            "defaultInputModes": [
+                "text",
+                "text/plain",
+                "application/json"
+            ],
+            "defaultOutputModes": [
+                "text",
+                "text/plain",
+                "application/json"
+            ],
+            "skills": [
+                {
+                    "id": "email_management",
+                    "name": "Email Composition & Management",
+                    "description": "Create professional emails and manage email templates",
+                    "examples": [
+                        "Write a professional follow-up email",
+                        "Generate an email template for networking"
+                    ],
+                    "tags": [
+                        "email",
+                        "composition",
+                        "templates",
+                        "professional"
+                    ]
+                },
+                {
+                    "id": "contact_management",
+                    "name": "Contact Database Operations",
+                    "description": "Search and retrieve contact information from database",
+                    "examples": [
+                        "Find contact information for John Smith",
+                        "Search for contacts in the tech industry"
                     ],
-                    "paths": {
-                        "/a2a": {
-                            "post": {
-                                "summary": "A2A Protocol Endpoint",
-                                "description": "Main A2A protocol endpoint for all methods",
-                                "requestBody": {
-                                    "required": True,
-                                    "content": {
-                                        "application/json": {
-                                            "schema": {
-                                                "type": "object",
-                                                "properties": {
-                                                    "jsonrpc": {"type": "string"},
-                                                    "id": {"type": "string"},
-                                                    "method": {"type": "string"},
-                                                    "params": {"type": "object"}
-                                                }
-                                            }
+                    "tags": [
+                        "contacts",
+                        "database",
+                        "search",
+                        "relationships"
+                    ]
+                },
+                {
+                    "id": "professional_networking",
+                    "name": "Strategic Networking",
+                    "description": "Build professional relationships and networking strategies",
+                    "examples": [
+                        "Create a 3-way introduction strategy",
+                        "Develop networking follow-up plan"
+                    ],
+                    "tags": [
+                        "networking",
+                        "relationships",
+                        "strategy",
+                        "professional"
+                    ]
+                },
+                {
+                    "id": "agent_collaboration",
+                    "name": "Multi-Agent Collaboration",
+                    "description": "Coordinate with other AI agents for complex workflows",
+                    "examples": [
+                        "Delegate email writing to specialized agent",
+                        "Collaborate with multiple agents for project"
+                    ],
+                    "tags": [
+                        "collaboration",
+                        "workflow",
+                        "orchestration",
+                        "multi-agent"
+                    ]
+                }
+            ]
+        }
+    
+    def _build_ai_plugin(self) -> Dict[str, Any]:
+        """Build the AI plugin manifest"""
+        return {
+            "schema_version": "v1",
+            "name_for_model": "MESH A2A Agent",
+            "name_for_human": "MESH - Professional Email & Networking Assistant",
+            "description_for_model": "MESH is a professional email management and networking assistant that can collaborate with other AI agents to provide enhanced capabilities.",
+            "description_for_human": "Professional email management, contact management, and networking with multi-agent collaboration capabilities.",
+            "auth": {
+                "type": "none"
+            },
+            "api": {
+                "type": "openapi",
+                "url": f"{self._base_url}/openapi.json"
+            },
+            "logo_url": "https://github.com/vishalm/agentic-protocol-demos/raw/main/resources/MESH-I-1.png",
+            "contact_email": "vishal.mishra@example.com",
+            "legal_info_url": "https://github.com/vishalm/agentic-protocol-demos/blob/main/LICENSE"
+        }
+    
+    def _build_openapi_schema(self) -> Dict[str, Any]:
+        """Build the simplified OpenAPI schema for A2A Inspector"""
+        return {
+            "openapi": "3.0.0",
+            "info": {
+                "title": "MESH A2A Server",
+                "version": "1.0.0",
+                "description": "A2A Protocol Server for MESH Integration"
+            },
+            "servers": [
+                {
+                    "url": self._base_url,
+                    "description": "MESH A2A Server"
+                }
+            ],
+            "paths": {
+                "/a2a": {
+                    "post": {
+                        "summary": "A2A Protocol Endpoint",
+                        "description": "Main A2A protocol endpoint for all methods",
+                        "requestBody": {
+                            "required": True,
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "type": "object",
+                                        "properties": {
+                                            "jsonrpc": {"type": "string"},
+                                            "id": {"type": "string"},
+                                            "method": {"type": "string"},
+                                            "params": {"type": "object"}
                                         }
                                     }
-                                },
-                                "responses": {
-                                    "200": {
-                                        "description": "Successful A2A response"
-                                    }
                                 }
                             }
                         },
-                        "/agents": {
-                            "get": {
-                                "summary": "List Discovered Agents",
-                                "description": "Get list of discovered A2A agents"
-                            }
-                        },
-                        "/workflows": {
-                            "get": {
-                                "summary": "List Workflow Templates",
-                                "description": "Get available workflow templates"
-                            },
-                            "post": {
-                                "summary": "Create Workflow",
-                                "description": "Create a new workflow from template"
+                        "responses": {
+                            "200": {
+                                "description": "Successful A2A response"
                             }
                         }
                     }
+                },
+                "/agents": {
+                    "get": {
+                        "summary": "List Discovered Agents",
+                        "description": "Get list of discovered A2A agents"
+                    }
+                },
+                "/workflows": {
+                    "get": {
+                        "summary": "List Workflow Templates",
+                        "description": "Get available workflow templates"
+                    },
+                    "post": {
+                        "summary": "Create Workflow",
+                        "description": "Create a new workflow from template"
+                    }
                 }
-                
-                return openapi_schema
-                
-            except Exception as e:
-                logger.error(f"Error generating OpenAPI schema: {e}")
-                raise HTTPException(status_code=500, detail=str(e))
+            }
+        }
+    
+    async def _handle_batch(self, calls: List[Any]) -> bytes:
+        """Handle a batched WebSocket frame, returning one encoded JSON-RPC reply"""
+        if not calls:
+            # An empty batch gets a single Invalid Request error, not an array
+            return orjson.dumps({"jsonrpc": "2.0", "id": None, "error": _INVALID_REQUEST})
+        responses = await asyncio.gather(*(self._handle_ws_call(call) for call in calls))
+        return b"[" + b",".join(responses) + b"]"
+    
+    async def _handle_ws_call(self, call: Any) -> bytes:
+        """Handle one WebSocket JSON-RPC call, returning encoded JSON"""
+        error = self._request_error(call)
+        if error is not None:
+            request_id = call.get("id") if isinstance(call, dict) else None
+            return orjson.dumps({"jsonrpc": "2.0", "id": request_id, "error": error})
+        try:
+            result = await self._handle_a2a_request(call["method"], call.get("params") or {})
+            return orjson.dumps({
+                "jsonrpc": "2.0",
+                "id": call.get("id"),
+                "result": result
+            }, default=_orjson_default)
+        except Exception as e:
+            return orjson.dumps({
+                "jsonrpc": "2.0",
+                "id": call.get("id"),
+                "error": {
+                    "code": -32603,
+                    "message": "Internal error",
+                    "data": str(e)
+                }
+            })
     
-    async def _handle_a2a_request(self, request: A2ARequest) -> Dict[str, Any]:
+    def _request_error(self, request: Any) -> Optional[Dict[str, Any]]:
+        """JSON-RPC error for a request that cannot be dispatched, or None"""
+        if not isinstance(request, dict):
+            return _INVALID_REQUEST
+        method = request.get("method")
+        if not isinstance(method, str) or not isinstance(request.get("params") or {}, dict):
+            return _INVALID_REQUEST
+        if method not in self._sync_method_dispatch and method not in self._method_dispatch:
+            return {"code": -32601, "message": f"Method not found: {method}", "data": None}
+        return None
+    
+    def _health_timestamp(self) -> str:
+        """Current time for the /health body, refreshed at most once per TTL"""
+        now = time.monotonic()
+        if now - self._timestamp_refreshed_at >= TIMESTAMP_TTL_SECONDS:
+            self._timestamp_refreshed_at = now
+            self._timestamp_iso = datetime.now().isoformat()
+        return self._timestamp_iso
+    
+    async def _handle_a2a_request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle A2A protocol requests"""
-        method = request.method
-        params = request.params or {}
-        
-        logger.info(f"Handling A2A request: {method}")
+        logger.debug("Handling A2A request: %s", method)
         
         try:
-            if method == "initialize":
-                return await self._handle_initialize(params)
-            elif method == "capabilities":
-                return await self._handle_capabilities(params)
-            elif method == "methods":
-                return await self._handle_methods(params)
-            elif method == "discover_agents":
-                return await self._handle_discover_agents(params)
-            elif method == "delegate_task":
-                return await self._handle_delegate_task(params)
-            elif method == "collaborate":
-                return await self._handle_collaborate(params)
-            elif method == "get_contact_info":
-                return await self._handle_get_contact_info(params)
-            elif method == "suggest_email_template":
-                return await self._handle_suggest_email_template(params)
-            elif method == "write_email_draft":
-                return await self._handle_write_email_draft(params)
-            else:
+            handler = self._sync_method_dispatch.get(method)
+            if handler is not None:
+                return handler(params)
+            handler = self._method_dispatch.get(method)
+            if handler is None:
                 raise ValueError(f"Unknown method: {method}")
+            return await handler(params)
                 
         except Exception as e:
             logger.error(f"Error handling method {method}: {e}")
             raise
     
-    async def _handle_initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle initialize method"""
         client_info = params.get("client_info", {})
         client_capabilities = params.get("capabilities", {})
@@ -534,17 +802,25 @@ class A2AServer:
             "timestamp": datetime.now().isoformat()
         }
     
-    async def _handle_capabilities(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_capabilities(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle capabilities method"""
+        return self._capabilities_result
+    
+    def _handle_methods(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle methods method"""
+        return self._methods_result
+    
+    def _build_capabilities_result(self) -> Dict[str, Any]:
+        """Build the capabilities method result"""
         return {
-            "capabilities": mesh_capabilities.capabilities,
+            "capabilities": dict(mesh_capabilities.capabilities),
             "methods": mesh_capabilities.list_methods(),
             "data_sources": ["directory.csv", "email-examples/", "prompts/"],
-            "performance_metrics": list(mesh_capabilities.capabilities.values())[0].performance_metrics if mesh_capabilities.capabilities else {}
+            "performance_metrics": next(iter(mesh_capabilities.capabilities.values())).performance_metrics if mesh_capabilities.capabilities else {}
         }
     
-    async def _handle_methods(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle methods method"""
+    def _build_methods_result(self) -> Dict[str, Any]:
+        """Build the methods method result"""
         methods_info = {}
         for method_name in mesh_capabilities.list_methods():
             method = mesh_capabilities.get_method_info(method_name)
@@ -617,7 +893,8 @@ class A2AServer:
         expertise = params.get("expertise")
         
         # Simulate contact lookup
-        await asyncio.sleep(0.2)
+        if self._simulate_latency:
+            await asyncio.sleep(0.2)
         
         if name:
             return {
@@ -653,33 +930,16 @@ class A2AServer:
         urgency = params.get("urgency", "normal")
         
         # Simulate template suggestion
-        await asyncio.sleep(0.1)
+        if self._simulate_latency:
+            await asyncio.sleep(0.1)
         
-        templates = {
-            "introduction": {
-                "template": "email-examples://3-way-intro",
-                "description": "Professional 3-way introduction template",
-                "best_for": "Connecting two people who could benefit from knowing each other"
-            },
-            "follow-up": {
-                "template": "email-examples://call-follow-up",
-                "description": "Call follow-up template with action items",
-                "best_for": "Following up after meetings or calls"
-            }
-        }
-        
-        context_lower = context.lower()
-        suggested_template = None
-        
-        for key, template_info in templates.items():
-            if key in context_lower:
-                suggested_template = template_info
-                break
+        match = _EMAIL_TEMPLATE_MATCHER.search(context.lower())
+        suggested_template = _EMAIL_TEMPLATES[match.group(0)] if match else None
         
         return {
             "suggested_template": suggested_template,
             "context": context,
-            "available_templates": list(templates.keys()),
+            "available_templates": _EMAIL_TEMPLATE_NAMES,
             "message": "Template suggestion based on context"
         }
     
@@ -695,9 +955,10 @@ class A2AServer:
             raise ValueError("recipient_email, subject, and body are required")
         
         # Simulate email draft creation
-        await asyncio.sleep(0.5)
+        if self._simulate_latency:
+            await asyncio.sleep(0.5)
         
-        draft_id = f"draft_{int(time.time())}_{hash(recipient_email) % 1000}"
+        draft_id = f"draft_{self._draft_prefix}_{next(self._draft_seq)}"
         
         return {
             "status": "success",
@@ -713,217 +974,176 @@ class A2AServer:
     
     async def _handle_direct_method(self, request: dict):
         """Handle direct method calls"""
+        # Pull the request fields out once; handlers and _envelope work on these
+        request_id = request.get("id", "unknown")
         try:
             method = request.get("method", "")
-            params = request.get("params", {})
+            params = request.get("params") or {}
+            if not isinstance(method, str) or not isinstance(params, dict):
+                return self._envelope(request_id, error=_INVALID_REQUEST)
             
-            logger.info(f"🔍 _handle_direct_method called with method: '{method}'")
-            logger.info(f"🔍 Request params: {params}")
+            logger.debug("🔍 _handle_direct_method called with method: %r", method)
+            logger.debug("🔍 Request params: %r", params)
             
-            if method == "initialize":
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request.get("id", "unknown"),
-                    "result": {
-                        "status": "success",
-                        "agent_info": {
-                            "name": "mesh_agent",
-                            "version": "1.0.0",
-                            "capabilities": ["email_management", "contact_management", "professional_networking", "collaboration"]
-                        }
-                    }
-                }
-            elif method == "capabilities":
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request.get("id", "unknown"),
-                    "result": {
-                        "capabilities": {
-                            "streaming": False,
-                            "collaboration": True,
-                            "workflow": True
-                        },
-                        "skills": [
-                            "email_management",
-                            "contact_management", 
-                            "professional_networking",
-                            "agent_collaboration"
-                        ]
-                    }
-                }
-            elif method == "methods":
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request.get("id", "unknown"),
-                    "result": {
-                        "methods": [
-                            "initialize",
-                            "capabilities", 
-                            "methods",
-                            "write_email_draft",
-                            "get_contact_info",
-                            "suggest_email_template",
-                            "discover_agents",
-                            "delegate_task",
-                            "collaborate"
-                        ]
-                    }
-                }
-            elif method == "write_email_draft":
-                recipient = params.get("recipient", "unknown")
-                subject = params.get("subject", "No Subject")
-                context = params.get("context", "")
-                
-                # Generate email content based on context
-                if "follow-up" in context.lower():
-                    email_body = f"Hi {recipient},\n\nThank you for our recent conversation. I wanted to follow up on the points we discussed.\n\nBest regards,\nMESH Assistant"
-                elif "networking" in context.lower():
-                    email_body = f"Hi {recipient},\n\nI hope this email finds you well. I'm reaching out to connect and explore potential collaboration opportunities.\n\nBest regards,\nMESH Assistant"
-                else:
-                    email_body = f"Hi {recipient},\n\n{context}\n\nBest regards,\nMESH Assistant"
-                
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request.get("id", "unknown"),
-                    "result": {
-                        "email_draft": {
-                            "to": recipient,
-                            "subject": subject,
-                            "body": email_body,
-                            "status": "draft_created"
-                        }
-                    }
-                }
-            elif method == "get_contact_info":
-                query = params.get("query", "")
-                # Mock contact search
-                contacts = [
-                    {"name": "John Smith", "email": "john@example.com", "company": "Tech Corp"},
-                    {"name": "Sarah Johnson", "email": "sarah@example.com", "company": "Innovation Inc"}
-                ]
-                
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request.get("id", "unknown"),
-                    "result": {
-                        "contacts": contacts,
-                        "query": query,
-                        "count": len(contacts)
-                    }
-                }
-            elif method == "message/send":
-                # Handle message/send method for A2A Inspector conversation
-                logger.info(f"🔍 Processing message/send method")
-                message = params.get("message", {})
-                message_text = ""
-                
-                logger.info(f"🔍 Message object: {message}")
-                
-                # Extract text from message parts
-                if "parts" in message:
-                    for part in message["parts"]:
-                        if part.get("kind") == "text" or part.get("type") == "text":
-                            message_text += part.get("text", "")
-                
-                logger.info(f"🔍 Extracted message text: '{message_text}'")
-                
-                # Process the message and generate response
-                response_text = self._process_message(message_text)
-                logger.info(f"🔍 Generated response text: '{response_text[:100]}...'")
-                
-                # Generate unique IDs
-                import uuid
-                from datetime import datetime
-                
-                message_id = f"msg-{int(datetime.now().timestamp())}-{str(uuid.uuid4())[:8]}"
-                task_id = f"task-{int(datetime.now().timestamp())}-{str(uuid.uuid4())[:8]}"
-                context_id = f"ctx-{int(datetime.now().timestamp())}-{str(uuid.uuid4())[:8]}"
-                
-                logger.info(f"🔍 Generated IDs - Message: {message_id}, Task: {task_id}, Context: {context_id}")
-                
-                # Return the CORRECT format with ALL required fields
-                # A2A Inspector expects flattened structure with specific field values
-                response = {
-                    "jsonrpc": "2.0",
-                    "id": request.get("id", message_id),
-                    "result": {
-                        # Task fields - flattened as A2A Inspector expects
-                        "id": task_id,
-                        "contextId": context_id,
-                        "status": "completed",  # Simple string as expected
-                        # Message fields - flattened as A2A Inspector expects
-                        "messageId": message_id,
-                        "parts": [
-                            {
-                                "type": "text",
-                                "text": response_text
-                            }
-                        ],
-                        "role": "agent"  # Must be 'agent' not 'assistant'
-                    }
-                }
-                
-                logger.info(f"🔍 Returning response: {response}")
-                return response
-            else:
+            handler = self._direct_method_dispatch.get(method)
+            if handler is None:
                 # Handle unknown methods
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request.get("id", "unknown"),
-                    "error": {
-                        "code": -32601,
-                        "message": f"Method not found: {method}",
-                        "data": None
-                    }
-                }
+                return self._envelope(request_id, error={
+                    "code": -32601,
+                    "message": f"Method not found: {method}",
+                    "data": None
+                })
+            if method == "message/send" and not self._message_parts_valid(params):
+                return self._envelope(request_id, error=_INVALID_PARAMS)
+            result = handler(params)
+            if method == "message/send" and "id" not in request:
+                # message/send replies without a request id echo the generated message id
+                return self._envelope(result["messageId"], result=result)
+            return self._envelope(request_id, result=result)
                     
         except Exception as e:
             logger.error(f"Error handling direct method: {e}")
-            return {
-                "jsonrpc": "2.0",
-                "id": request.get("id", "unknown"),
-                "error": {
-                    "code": -32603,
-                    "message": "Internal error",
-                    "data": str(e)
-                }
+            return self._envelope(request_id, error={
+                "code": -32603,
+                "message": "Internal error",
+                "data": str(e)
+            })
+    
+    @staticmethod
+    def _message_parts_valid(params: Dict[str, Any]) -> bool:
+        """Whether message/send params carry a list of part objects, if any"""
+        message = params.get("message")
+        if not isinstance(message, dict) or "parts" not in message:
+            # A missing or non-object message is answered as an empty one
+            return True
+        parts = message["parts"]
+        return isinstance(parts, list) and all(isinstance(part, dict) for part in parts)
+    
+    @staticmethod
+    def _envelope(request_id: Any, result: Optional[Dict[str, Any]] = None,
+                  error: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Wrap a direct method result or error in a JSON-RPC response"""
+        if error is not None:
+            return {"jsonrpc": "2.0", "id": request_id, "error": error}
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+    
+    def _rpc_initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Direct initialize method"""
+        return _DIRECT_INITIALIZE_RESULT
+    
+    def _rpc_capabilities(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Direct capabilities method"""
+        return _DIRECT_CAPABILITIES_RESULT
+    
+    def _rpc_methods(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Direct methods method"""
+        return _DIRECT_METHODS_RESULT
+    
+    def _rpc_write_email_draft(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Direct write_email_draft method"""
+        recipient = params.get("recipient", "unknown")
+        subject = params.get("subject", "No Subject")
+        context = params.get("context", "")
+        context_lower = context.lower()
+        
+        # Generate email content based on context
+        if "follow-up" in context_lower:
+            email_body = f"Hi {recipient},\n\nThank you for our recent conversation. I wanted to follow up on the points we discussed.\n\nBest regards,\nMESH Assistant"
+        elif "networking" in context_lower:
+            email_body = f"Hi {recipient},\n\nI hope this email finds you well. I'm reaching out to connect and explore potential collaboration opportunities.\n\nBest regards,\nMESH Assistant"
+        else:
+            email_body = f"Hi {recipient},\n\n{context}\n\nBest regards,\nMESH Assistant"
+        
+        return {
+            "email_draft": {
+                "to": recipient,
+                "subject": subject,
+                "body": email_body,
+                "status": "draft_created"
             }
+        }
+    
+    def _rpc_get_contact_info(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Direct get_contact_info method"""
+        query = params.get("query", "")
+        # Mock contact search
+        contacts = [
+            {"name": "John Smith", "email": "john@example.com", "company": "Tech Corp"},
+            {"name": "Sarah Johnson", "email": "sarah@example.com", "company": "Innovation Inc"}
+        ]
+        
+        return {
+            "contacts": contacts,
+            "query": query,
+            "count": len(contacts)
+        }
+    
+    def _rpc_message_send(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Direct message/send method for A2A Inspector conversation"""
+        logger.debug("🔍 Processing message/send method")
+        message = params.get("message", {})
+        
+        logger.debug("🔍 Message object: %r", message)
+        
+        # Extract text from message parts; a non-object message has none
+        parts = message.get("parts", ()) if isinstance(message, dict) else ()
+        message_text = "".join(
+            part.get("text", "") for part in parts
+            if part.get("kind") == "text" or part.get("type") == "text"
+        )
+        
+        logger.debug("🔍 Extracted message text: %r", message_text)
+        
+        # Process the message and generate response
+        response_text = self._process_message(message_text)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 Generated response text: %r...", response_text[:100])
+        
+        # Generate unique IDs from one timestamp and one random UUID
+        timestamp = int(time.time())
+        suffix = uuid.uuid4().hex
+        message_id = f"msg-{timestamp}-{suffix[:8]}"
+        task_id = f"task-{timestamp}-{suffix[8:16]}"
+        context_id = f"ctx-{timestamp}-{suffix[16:24]}"
+        
+        logger.debug("🔍 Generated IDs - Message: %s, Task: %s, Context: %s", message_id, task_id, context_id)
+        
+        # Return the CORRECT format with ALL required fields
+        # A2A Inspector expects flattened structure with specific field values
+        result = {
+            # Task fields - flattened as A2A Inspector expects
+            "id": task_id,
+            "contextId": context_id,
+            "status": "completed",  # Simple string as expected
+            # Message fields - flattened as A2A Inspector expects
+            "messageId": message_id,
+            "parts": [
+                {
+                    "type": "text",
+                    "text": response_text
+                }
+            ],
+            "role": "agent"  # Must be 'agent' not 'assistant'
+        }
+        
+        logger.debug("🔍 Returning result: %r", result)
+        return result
     
     def _process_message(self, message_text: str) -> str:
         """Process incoming messages and generate intelligent responses"""
-        message_lower = message_text.lower()
-        
-        # Email-related queries
-        if any(word in message_lower for word in ["email", "draft", "compose", "write"]):
-            if "template" in message_lower:
-                return "I can help you with email templates! I offer several professional templates:\n\n1. **Follow-up Template** - For post-meeting follow-ups\n2. **Networking Template** - For building professional connections\n3. **Introduction Template** - For 3-way introductions\n4. **Thank You Template** - For post-interview follow-ups\n\nWould you like me to generate a specific template for you?"
-            elif "professional" in message_lower:
-                return "I specialize in creating professional emails! I can help you with:\n\n• Business follow-ups\n• Networking outreach\n• Professional introductions\n• Thank you notes\n• Meeting confirmations\n\nJust let me know what type of email you need and I'll craft it for you."
-            else:
-                return "I'm your email composition assistant! I can help you create professional emails, suggest templates, and manage your email communications. What type of email would you like help with?"
-        
-        # Contact-related queries
-        elif any(word in message_lower for word in ["contact", "database", "search", "find"]):
-            return "I can help you search and manage your contact database! I can:\n\n• Search for contacts by name, company, or industry\n• Provide contact details and relationship history\n• Suggest networking opportunities\n• Help organize your professional network\n\nWhat contact information are you looking for?"
-        
-        # Networking-related queries
-        elif any(word in message_lower for word in ["network", "introduction", "connect", "relationship"]):
-            if "3-way" in message_lower or "introduction" in message_lower:
-                return "I'm excellent at 3-way introductions! This involves connecting two people through a mutual contact. I can help you:\n\n• Identify potential connections\n• Craft introduction messages\n• Follow up on introductions\n• Build your professional network strategically\n\nWould you like me to help you set up a 3-way introduction?"
-            else:
-                return "I can help you build and manage your professional network! I offer:\n\n• Strategic networking strategies\n• Introduction management\n• Follow-up planning\n• Relationship tracking\n• Networking opportunity identification\n\nWhat networking goal would you like to work on?"
-        
-        # Collaboration-related queries
-        elif any(word in message_lower for word in ["collaborate", "workflow", "agent", "coordinate"]):
-            return "I'm designed for multi-agent collaboration! I can:\n\n• Coordinate with other AI agents\n• Execute complex workflows\n• Delegate tasks to specialized agents\n• Manage multi-step processes\n• Orchestrate team efforts\n\nWhat kind of collaboration or workflow would you like to explore?"
-        
-        # General queries
-        elif any(word in message_lower for word in ["help", "what can you do", "capabilities", "skills"]):
-            return "I'm MESH, your professional email management and networking assistant! Here's what I can do:\n\n📧 **Email Management**\n• Compose professional emails\n• Generate email templates\n• Manage follow-ups\n\n👥 **Contact Management**\n• Search contact database\n• Track relationships\n• Organize network\n\n🤝 **Professional Networking**\n• Strategic networking\n• 3-way introductions\n• Relationship building\n\n🔄 **Multi-Agent Collaboration**\n• Workflow orchestration\n• Task delegation\n• Team coordination\n\nHow can I help you today?"
+        # Surrounding whitespace never changes the topic, so it is left out of the cache key
+        message_key = message_text.lower().strip()
         
-        # Default response
+        # The highest-priority topic mentioned wins, in the order of _INTENT_ROUTES
+        if len(message_key) <= INTENT_CACHE_MAX_CHARS:
+            reply = _cached_intent_reply(message_key)
         else:
-            return f"I understand you're asking about: '{message_text}'\n\nAs your professional email and networking assistant, I can help you with:\n\n• Creating professional emails and templates\n• Managing your contact database\n• Building strategic professional relationships\n• Coordinating multi-agent workflows\n\nCould you please rephrase your question or let me know what specific help you need?"
+            reply = _intent_reply(message_key)
+        if reply is not None:
+            return reply
+        
+        # Default response
+        return f"I understand you're asking about: '{message_text}'\n\nAs your professional email and networking assistant, I can help you with:\n\n• Creating professional emails and templates\n• Managing your contact database\n• Building strategic professional relationships\n• Coordinating multi-agent workflows\n\nCould you please rephrase your question or let me know what specific help you need?"
     
     async def start(self):
         """Start the A2A server"""
@@ -932,7 +1152,7 @@ class A2AServer:
         # Start agent manager
         await agent_manager.start()
         
-        logger.info(f"A2A server ready on {default_server_config.host}:{default_server_config.port}")
+        logger.info(f"A2A server ready on {get_server_config().host}:{get_server_config().port}")
     
     async def stop(self):
         """Stop the A2A server"""
@@ -946,15 +1166,28 @@ class A2AServer:
 # Global instance
 a2a_server = A2AServer()
 
+def create_worker_app() -> FastAPI:
+    """Build the app for a uvicorn worker process, starting services on lifespan"""
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        await a2a_server.start()
+        yield
+        await a2a_server.stop()
+    
+    a2a_server.app.router.lifespan_context = lifespan
+    return a2a_server.app
+
 if __name__ == "__main__":
     print("A2A Server Module")
     print("=" * 30)
     
     import uvicorn
     import os
+    import sys
     
-    # Get port from environment variable or use default
-    port = int(os.environ.get('A2A_PORT', default_server_config.port))
+    # Get port and worker count from environment variables or use defaults
+    port = int(os.environ.get('A2A_PORT', get_server_config().port))
+    workers = int(os.environ.get('A2A_WORKERS', 1))
     
     async def main():
         """Main function to run the A2A server"""
@@ -963,13 +1196,44 @@ if __name__ == "__main__":
         # Run the FastAPI app
         config = uvicorn.Config(
             app=a2a_server.app,
-            host=default_server_config.host,
+            host=get_server_config().host,
             port=port,
-            log_level=default_server_config.log_level
+            http="httptools",
+            ws="websockets",
+            log_level=get_server_config().log_level
         )
         
         server = uvicorn.Server(config)
         await server.serve()
     
+    # Serve on io_uring (uringcore) when the package and kernel support it,
+    # otherwise on uvloop's libuv-based event loop (not available on Windows)
+    if sys.platform == "linux":
+        try:
+            import uringcore
+            uringcore.EventLoopPolicy().new_event_loop().close()
+            asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+        except (ImportError, OSError) as e:
+            logger.info(f"io_uring event loop unavailable ({e}), falling back to uvloop")
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    elif sys.platform != "win32":
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     # Run the server
-    asyncio.run(main())
+    if workers > 1:
+        # Pre-forked workers share the listening socket and each builds its
+        # own A2AServer, so in-memory workflow state is per worker
+        uvicorn.run(
+            "a2a_server:create_worker_app",
+            factory=True,
+            host=get_server_config().host,
+            port=port,
+            workers=workers,
+            http="httptools",
+            ws="websockets",
+            log_level=get_server_config().log_level
+        )
+    else:
+        asyncio.run(main())
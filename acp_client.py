@@ -4,25 +4,223 @@ Demonstrates how to interact with the ACP server
 """
 
 import asyncio
-import json
 import logging
-import uuid
+import secrets
+import sys
+import time
+from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, Iterator, List, NamedTuple, Optional, Tuple
 import httpx
+import orjson
+
+try:
+    import aiohttp
+except ImportError:  # optional, only needed by AiohttpACPClient
+    aiohttp = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class ACPClient:
-    """ACP client for communicating with the ACP server"""
+# Connection pool for the shared session; every call goes to the same host,
+# so keep plenty of idle connections alive for reuse
+CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=200, keepalive_expiry=60.0)
+CLIENT_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# Most task ids sent in one /tasks?ids= lookup, keeping URLs well under length limits
+TASK_IDS_PER_REQUEST = 200
+
+# Seconds that health and agent-list results are reused before refetching
+CLIENT_CACHE_TTL = 10.0
+
+# Request bodies are encoded with orjson, so they carry their own content type
+_JSON_HEADERS = {"content-type": "application/json"}
+# Health replies are tiny; ask for them uncompressed
+_HEALTH_HEADERS = {"accept-encoding": "identity"}
+# Asks listing endpoints to stream one JSON document per line
+_NDJSON_HEADERS = {"accept": "application/x-ndjson"}
+
+# Bound once for the timestamp on every task and the codec on every request
+_now = datetime.now
+_UTC = timezone.utc
+_dumps = orjson.dumps
+_loads = orjson.loads
+
+def _status_error(failure: str, code: int, reason: Optional[str]) -> Dict[str, Any]:
+    """Log and build the error result for an HTTP error status"""
+    logger.error("%s: HTTP %s %s", failure, code, reason)
+    return {"status": "error", "code": code, "error": f"HTTP {code} {reason}"}
+
+def _request_error(failure: str, error: Exception) -> Dict[str, Any]:
+    """Log and build the error result for a failed or undecodable request"""
+    logger.error("%s: %s", failure, error)
+    return {"status": "error", "error": str(error)}
+
+class _RequestSpec(NamedTuple):
+    """One encoded ACP request and how to report its outcome"""
+    method: str
+    path: str
+    failure: str
+    content: Optional[bytes]
+    params: Optional[Dict[str, Any]]
+    headers: Optional[Dict[str, str]]
+    decode: bool
+
+class _ACPClientBase(ABC):
+    """Payload building, reply handling and caching shared by every ACP client"""
+    
+    # Transport exceptions reported as an error result instead of raising
+    _transport_errors: Tuple[type, ...] = (httpx.HTTPError,)
     
-    def __init__(self, base_url: str = "http://127.0.0.1:8081"):
+    def __init__(self, base_url: str = "http://127.0.0.1:8081", http2: bool = False,
+                 uds: Optional[str] = None, cache_ttl: float = CLIENT_CACHE_TTL):
         self.base_url = base_url
-        self.client_id = f"client-{uuid.uuid4().hex[:8]}"
-        self.session = httpx.AsyncClient(timeout=30.0)
-        logger.info(f"ACP Client initialized: {self.client_id}")
+        self.client_id = f"client-{secrets.token_hex(4)}"
+        self.session = self._open_session(http2, uds)
+        # Fields shared by every task this client sends
+        self._task_base = MappingProxyType({"type": "task", "sender": self.client_id})
+        # path -> (monotonic expiry, decoded body) for slow-changing GETs
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        logger.info("ACP Client initialized: %s", self.client_id)
+    
+    # Subclasses supply the transport: the session and streaming
+    @abstractmethod
+    def _open_session(self, http2: bool, uds: Optional[str]):
+        """Create the shared HTTP session"""
+    
+    @abstractmethod
+    def _iter_ndjson(self, path: str, params: Optional[Dict[str, Any]] = None):
+        """Stream a listing endpoint as NDJSON, yielding each item as soon as its line arrives"""
+    
+    @staticmethod
+    def _spec(method: str, path: str, failure: str, *,
+              json: Any = None, content: Optional[bytes] = None,
+              params: Optional[Dict[str, Any]] = None,
+              headers: Optional[Dict[str, str]] = None, decode: bool = True) -> _RequestSpec:
+        """Encode a request with a json or pre-encoded content body"""
+        if json is not None:
+            content = _dumps(json)
+        if content is not None:
+            headers = {**_JSON_HEADERS, **headers} if headers else _JSON_HEADERS
+        return _RequestSpec(method, path, failure, content, params, headers, decode)
+    
+    @staticmethod
+    def _reply(spec: _RequestSpec, status: int, reason: Optional[str], body: bytes) -> Dict[str, Any]:
+        """Decoded reply, its status alone when not decode, or an error dict"""
+        # Error replies are reported from the status line without decoding the body
+        if status >= 400:
+            return _status_error(spec.failure, status, reason)
+        if not spec.decode:
+            return {"status": "sent", "code": status}
+        try:
+            return _loads(body)
+        except ValueError as e:
+            return _request_error(spec.failure, e)
+    
+    def invalidate(self):
+        """Drop cached health and agent-list results so the next calls refetch"""
+        self._cache.clear()
+    
+    def _cached(self, path: str, now: float) -> Optional[Dict[str, Any]]:
+        """Return the cached result for path if it has not expired"""
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        return None
+    
+    def _remember(self, path: str, now: float, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache a successful result for cache_ttl seconds, and return it"""
+        if result.get("status") != "error":
+            self._cache[path] = (now + self.cache_ttl, result)
+        return result
+    
+    def _registered(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Registration result; the cached agent list no longer reflects the registry"""
+        self._cache.pop("/agents", None)
+        return result
+    
+    @staticmethod
+    def _manifest_body(manifest: Dict[str, Any]) -> Dict[str, Any]:
+        """Request body arguments for registering a manifest"""
+        if manifest is EXAMPLE_AGENT_MANIFEST:
+            # The example manifest is frozen and sent from its import-time encoding
+            return {"content": _EXAMPLE_MANIFEST_BYTES}
+        return {"json": manifest}
+    
+    def _task_message(self, task_type: str, parameters: Dict[str, Any],
+                      recipient: Optional[str], priority: int) -> Dict[str, Any]:
+        """Build the message for one task"""
+        return {
+            **self._task_base,
+            "recipient": recipient,
+            "task_type": task_type,
+            "parameters": parameters,
+            "priority": priority,
+            # orjson writes aware datetimes in the same ISO format as isoformat()
+            "timestamp": _now(_UTC)
+        }
+    
+    def _task_batch(self, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Build the messages for a batch of tasks, sharing one timestamp"""
+        timestamp = _now(_UTC)
+        return [
+            {
+                **self._task_base,
+                "recipient": task.get("recipient"),
+                "task_type": task["task_type"],
+                "parameters": task.get("parameters", {}),
+                "priority": task.get("priority", 1),
+                "timestamp": timestamp
+            }
+            for task in tasks
+        ]
+    
+    @staticmethod
+    def _task_id_params(task_ids: List[str]) -> List[Dict[str, str]]:
+        """Query params for bulk task lookups, TASK_IDS_PER_REQUEST ids each"""
+        return [
+            {"ids": ",".join(task_ids[i:i + TASK_IDS_PER_REQUEST])}
+            for i in range(0, len(task_ids), TASK_IDS_PER_REQUEST)
+        ]
+    
+    @staticmethod
+    def _merge_tasks(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Combine bulk task lookups, or return the first error"""
+        for result in results:
+            if result.get("status") == "error":
+                return result
+        return {"tasks": [task for result in results for task in result["tasks"]]}
+    
+    # Streaming listings return an async iterator on the async clients
+    # and a plain iterator on SyncACPClient
+    def iter_messages(self, limit: int = 1000, offset: int = 0):
+        """Stream recent messages one at a time instead of buffering the whole listing"""
+        return self._iter_ndjson("/messages", {"limit": limit, "offset": offset})
+    
+    def iter_tasks(self, status: Optional[str] = None):
+        """Stream tasks, optionally filtered by status, one at a time"""
+        return self._iter_ndjson("/tasks", {"status": status} if status else None)
+
+class ACPClient(_ACPClientBase):
+    """ACP client for communicating with the ACP server"""
+    
+    def _open_session(self, http2: bool, uds: Optional[str]) -> httpx.AsyncClient:
+        """Create the shared HTTP session"""
+        # With http2, concurrent calls multiplex as streams over one connection
+        # when the server negotiates HTTP/2 (over TLS); otherwise HTTP/1.1 is used.
+        # With uds, requests go over that Unix socket and base_url only sets the Host
+        transport = httpx.AsyncHTTPTransport(uds=uds, limits=CLIENT_LIMITS, http2=http2) if uds else None
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=CLIENT_TIMEOUT,
+            limits=CLIENT_LIMITS,
+            http2=http2,
+            transport=transport,
+            headers={"x-client-id": self.client_id}
+        )
     
     async def __aenter__(self):
         return self
@@ -34,112 +232,245 @@ class ACPClient:
         """Close the client session"""
         await self.session.aclose()
     
-    async def health_check(self) -> Dict[str, Any]:
-        """Check server health"""
+    async def _send(self, spec: _RequestSpec) -> Tuple[int, Optional[str], bytes]:
+        """Send one request and return its status code, reason and body"""
+        response = await self.session.request(spec.method, spec.path, content=spec.content,
+                                              params=spec.params, headers=spec.headers)
+        return response.status_code, response.reason_phrase, response.content
+    
+    async def _request(self, method: str, path: str, failure: str, **kwargs) -> Dict[str, Any]:
+        """Perform one request and turn its reply or transport failure into a result"""
+        spec = self._spec(method, path, failure, **kwargs)
         try:
-            response = await self.session.get(f"{self.base_url}/health")
+            return self._reply(spec, *await self._send(spec))
+        except self._transport_errors as e:
+            return _request_error(failure, e)
+    
+    async def _cached_get(self, path: str, failure: str,
+                          headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """GET path, reusing a successful result for cache_ttl seconds"""
+        now = time.monotonic()
+        cached = self._cached(path, now)
+        if cached is not None:
+            return cached
+        return self._remember(path, now, await self._request("GET", path, failure, headers=headers))
+    
+    async def _iter_ndjson(self, path: str, params: Optional[Dict[str, Any]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a listing endpoint as NDJSON, yielding each item as soon as its line arrives"""
+        async with self.session.stream("GET", path, params=params, headers=_NDJSON_HEADERS) as response:
             response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Health check failed: {e}")
-            return {"status": "error", "error": str(e)}
+            async for line in response.aiter_lines():
+                if line:
+                    yield _loads(line)
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """Check server health"""
+        return await self._cached_get("/health", "Health check failed", headers=_HEALTH_HEADERS)
     
     async def register_agent(self, manifest: Dict[str, Any]) -> Dict[str, Any]:
         """Register an agent with the ACP server"""
-        try:
-            response = await self.session.post(
-                f"{self.base_url}/agents/register",
-                json=manifest
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Agent registration failed: {e}")
-            return {"status": "error", "error": str(e)}
+        return self._registered(await self._request("POST", "/agents/register", "Agent registration failed",
+                                                    **self._manifest_body(manifest)))
     
     async def list_agents(self) -> Dict[str, Any]:
         """List all registered agents"""
-        try:
-            response = await self.session.get(f"{self.base_url}/agents")
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to list agents: {e}")
-            return {"status": "error", "error": str(e)}
-    
-    async def send_task(self, task_type: str, parameters: Dict[str, Any], 
-                       recipient: Optional[str] = None, priority: int = 1) -> Dict[str, Any]:
-        """Send a task to the ACP server"""
-        try:
-            task_message = {
-                "type": "task",
-                "sender": self.client_id,
-                "recipient": recipient,
-                "task_type": task_type,
-                "parameters": parameters,
-                "priority": priority,
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }
-            
-            response = await self.session.post(
-                f"{self.base_url}/messages",
-                json=task_message
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to send task: {e}")
-            return {"status": "error", "error": str(e)}
+        return await self._cached_get("/agents", "Failed to list agents")
+    
+    async def send_task(self, task_type: str, parameters: Dict[str, Any],
+                        recipient: Optional[str] = None, priority: int = 1,
+                        fire_and_forget: bool = False) -> Dict[str, Any]:
+        """Send a task to the ACP server; with fire_and_forget, skip decoding the reply and return only its status"""
+        task_message = self._task_message(task_type, parameters, recipient, priority)
+        return await self._request("POST", "/messages", "Failed to send task", json=task_message,
+                                   decode=not fire_and_forget)
+    
+    async def send_tasks_batch(self, tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Send several tasks (task_type plus optional parameters, recipient, priority) in one request"""
+        batch = self._task_batch(tasks)
+        return await self._request("POST", "/messages/batch", "Failed to send task batch", json=batch)
     
     async def get_task_status(self, task_id: str) -> Dict[str, Any]:
         """Get the status of a specific task"""
-        try:
-            response = await self.session.get(f"{self.base_url}/tasks/{task_id}")
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to get task status: {e}")
-            return {"status": "error", "error": str(e)}
+        return await self._request("GET", f"/tasks/{task_id}", "Failed to get task status")
+    
+    async def get_task_statuses(self, task_ids: List[str]) -> Dict[str, Any]:
+        """Get several tasks in bulk, one concurrent request per TASK_IDS_PER_REQUEST ids"""
+        results = await asyncio.gather(*(
+            self._request("GET", "/tasks", "Failed to get task statuses", params=params)
+            for params in self._task_id_params(task_ids)
+        ))
+        return self._merge_tasks(results)
     
     async def list_tasks(self, status: Optional[str] = None) -> Dict[str, Any]:
         """List all tasks with optional status filter"""
-        try:
-            params = {}
-            if status:
-                params["status"] = status
-            
-            response = await self.session.get(f"{self.base_url}/tasks", params=params)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to list tasks: {e}")
-            return {"status": "error", "error": str(e)}
+        params = {"status": status} if status else None
+        return await self._request("GET", "/tasks", "Failed to list tasks", params=params)
     
     async def cancel_task(self, task_id: str) -> Dict[str, Any]:
         """Cancel a running task"""
-        try:
-            response = await self.session.delete(f"{self.base_url}/tasks/{task_id}")
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to cancel task: {e}")
-            return {"status": "error", "error": str(e)}
+        return await self._request("DELETE", f"/tasks/{task_id}", "Failed to cancel task")
     
     async def list_messages(self, limit: int = 100, offset: int = 0) -> Dict[str, Any]:
         """List recent messages"""
-        try:
-            response = await self.session.get(
-                f"{self.base_url}/messages",
-                params={"limit": limit, "offset": offset}
+        return await self._request("GET", "/messages", "Failed to list messages",
+                                   params={"limit": limit, "offset": offset})
+
+class AiohttpACPClient(ACPClient):
+    """ACPClient on aiohttp, cheaper per request than httpx for many small calls (needs the optional aiohttp package)"""
+    
+    _transport_errors = (aiohttp.ClientError, asyncio.TimeoutError) if aiohttp is not None else ()
+    
+    def _open_session(self, http2: bool, uds: Optional[str]) -> None:
+        if aiohttp is None:
+            raise ImportError("AiohttpACPClient requires aiohttp (pip install aiohttp)")
+        if http2:
+            raise ValueError("aiohttp does not support HTTP/2")
+        self._uds = uds
+        # The session binds to the running loop, so it is created on first use
+        return None
+    
+    def _aiohttp_session(self) -> "aiohttp.ClientSession":
+        """Return the shared aiohttp session, creating it on the running loop"""
+        if self.session is None:
+            if self._uds:
+                connector = aiohttp.UnixConnector(path=self._uds, limit=CLIENT_LIMITS.max_connections,
+                                                  keepalive_timeout=CLIENT_LIMITS.keepalive_expiry)
+            else:
+                connector = aiohttp.TCPConnector(limit=CLIENT_LIMITS.max_connections,
+                                                 keepalive_timeout=CLIENT_LIMITS.keepalive_expiry)
+            self.session = aiohttp.ClientSession(
+                base_url=self.base_url,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=CLIENT_TIMEOUT.read, connect=CLIENT_TIMEOUT.connect),
+                headers={"x-client-id": self.client_id}
             )
+        return self.session
+    
+    async def close(self):
+        """Close the client session"""
+        if self.session is not None:
+            await self.session.close()
+    
+    async def _send(self, spec: _RequestSpec) -> Tuple[int, Optional[str], bytes]:
+        """Send one request and return its status code, reason and body"""
+        async with self._aiohttp_session().request(spec.method, spec.path, data=spec.content,
+                                                   params=spec.params, headers=spec.headers) as response:
+            # The body is always read so the connection goes back to the pool
+            return response.status, response.reason, await response.read()
+    
+    async def _iter_ndjson(self, path: str, params: Optional[Dict[str, Any]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a listing endpoint as NDJSON, yielding each item as soon as its line arrives"""
+        async with self._aiohttp_session().get(path, params=params, headers=_NDJSON_HEADERS) as response:
+            response.raise_for_status()
+            async for line in response.content:
+                if line.strip():
+                    yield _loads(line)
+
+class SyncACPClient(_ACPClientBase):
+    """Blocking ACP client for one-shot scripts; use ACPClient when calls should overlap"""
+    
+    def _open_session(self, http2: bool, uds: Optional[str]) -> httpx.Client:
+        """Create the shared HTTP session"""
+        transport = httpx.HTTPTransport(uds=uds, limits=CLIENT_LIMITS, http2=http2) if uds else None
+        return httpx.Client(
+            base_url=self.base_url,
+            timeout=CLIENT_TIMEOUT,
+            limits=CLIENT_LIMITS,
+            http2=http2,
+            transport=transport,
+            headers={"x-client-id": self.client_id}
+        )
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def close(self):
+        """Close the client session"""
+        self.session.close()
+    
+    def _request(self, method: str, path: str, failure: str, **kwargs) -> Dict[str, Any]:
+        """Perform one request and turn its reply or transport failure into a result"""
+        spec = self._spec(method, path, failure, **kwargs)
+        try:
+            response = self.session.request(spec.method, spec.path, content=spec.content,
+                                            params=spec.params, headers=spec.headers)
+        except self._transport_errors as e:
+            return _request_error(failure, e)
+        return self._reply(spec, response.status_code, response.reason_phrase, response.content)
+    
+    def _cached_get(self, path: str, failure: str,
+                    headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """GET path, reusing a successful result for cache_ttl seconds"""
+        now = time.monotonic()
+        cached = self._cached(path, now)
+        if cached is not None:
+            return cached
+        return self._remember(path, now, self._request("GET", path, failure, headers=headers))
+    
+    def _iter_ndjson(self, path: str, params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """Stream a listing endpoint as NDJSON, yielding each item as soon as its line arrives"""
+        with self.session.stream("GET", path, params=params, headers=_NDJSON_HEADERS) as response:
             response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to list messages: {e}")
-            return {"status": "error", "error": str(e)}
+            for line in response.iter_lines():
+                if line:
+                    yield _loads(line)
+    
+    def health_check(self) -> Dict[str, Any]:
+        """Check server health"""
+        return self._cached_get("/health", "Health check failed", headers=_HEALTH_HEADERS)
+    
+    def register_agent(self, manifest: Dict[str, Any]) -> Dict[str, Any]:
+        """Register an agent with the ACP server"""
+        return self._registered(self._request("POST", "/agents/register", "Agent registration failed",
+                                              **self._manifest_body(manifest)))
+    
+    def list_agents(self) -> Dict[str, Any]:
+        """List all registered agents"""
+        return self._cached_get("/agents", "Failed to list agents")
+    
+    def send_task(self, task_type: str, parameters: Dict[str, Any],
+                  recipient: Optional[str] = None, priority: int = 1,
+                  fire_and_forget: bool = False) -> Dict[str, Any]:
+        """Send a task to the ACP server; with fire_and_forget, skip decoding the reply and return only its status"""
+        task_message = self._task_message(task_type, parameters, recipient, priority)
+        return self._request("POST", "/messages", "Failed to send task", json=task_message,
+                             decode=not fire_and_forget)
+    
+    def send_tasks_batch(self, tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Send several tasks (task_type plus optional parameters, recipient, priority) in one request"""
+        batch = self._task_batch(tasks)
+        return self._request("POST", "/messages/batch", "Failed to send task batch", json=batch)
+    
+    def get_task_status(self, task_id: str) -> Dict[str, Any]:
+        """Get the status of a specific task"""
+        return self._request("GET", f"/tasks/{task_id}", "Failed to get task status")
+    
+    def get_task_statuses(self, task_ids: List[str]) -> Dict[str, Any]:
+        """Get several tasks in bulk, one request per TASK_IDS_PER_REQUEST ids"""
+        return self._merge_tasks([
+            self._request("GET", "/tasks", "Failed to get task statuses", params=params)
+            for params in self._task_id_params(task_ids)
+        ])
+    
+    def list_tasks(self, status: Optional[str] = None) -> Dict[str, Any]:
+        """List all tasks with optional status filter"""
+        params = {"status": status} if status else None
+        return self._request("GET", "/tasks", "Failed to list tasks", params=params)
+    
+    def cancel_task(self, task_id: str) -> Dict[str, Any]:
+        """Cancel a running task"""
+        return self._request("DELETE", f"/tasks/{task_id}", "Failed to cancel task")
+    
+    def list_messages(self, limit: int = 100, offset: int = 0) -> Dict[str, Any]:
+        """List recent messages"""
+        return self._request("GET", "/messages", "Failed to list messages",
+                             params={"limit": limit, "offset": offset})
 
-# Example agent manifest
-EXAMPLE_AGENT_MANIFEST = {
+# Example agent manifest (read-only; also pre-encoded for register_agent)
+EXAMPLE_AGENT_MANIFEST = MappingProxyType({
     "id": "email-assistant-agent",
     "name": "Email Assistant Agent",
     "description": "An AI agent specialized in email composition and management",
@@ -169,93 +500,114 @@ EXAMPLE_AGENT_MANIFEST = {
         "language": "Python",
         "protocol": "ACP"
     }
-}
+})
+_EXAMPLE_MANIFEST_BYTES = orjson.dumps(dict(EXAMPLE_AGENT_MANIFEST))
+
+def _write_lines(lines: List[str]):
+    """Write buffered demo lines to stdout in a single call and clear the buffer"""
+    if not lines:
+        return
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    lines.clear()
 
 async def demo_acp_communication():
     """Demonstrate ACP communication patterns"""
-    print("🚀 MESH ACP Communication Demo")
-    print("=" * 50)
+    # Lines are buffered and written once per step, right before it waits on the server
+    out: List[str] = []
+    out.append("🚀 MESH ACP Communication Demo")
+    out.append("=" * 50)
     
     async with ACPClient() as client:
         # 1. Health check
-        print("\n1️⃣ Checking server health...")
+        out.append("\n1️⃣ Checking server health...")
+        _write_lines(out)
         health = await client.health_check()
-        print(f"   Health: {health}")
+        out.append(f"   Health: {health}")
         
         if health.get("status") != "healthy":
-            print("❌ Server is not healthy. Make sure the ACP server is running.")
+            out.append("❌ Server is not healthy. Make sure the ACP server is running.")
+            _write_lines(out)
             return
         
         # 2. Register agent
-        print("\n2️⃣ Registering example agent...")
+        out.append("\n2️⃣ Registering example agent...")
+        _write_lines(out)
         registration = await client.register_agent(EXAMPLE_AGENT_MANIFEST)
-        print(f"   Registration: {registration}")
+        out.append(f"   Registration: {registration}")
         
         # 3. List agents
-        print("\n3️⃣ Listing registered agents...")
+        out.append("\n3️⃣ Listing registered agents...")
+        _write_lines(out)
         agents = await client.list_agents()
-        print(f"   Agents: {len(agents.get('agents', []))} found")
+        out.append(f"   Agents: {len(agents.get('agents', []))} found")
         
-        # 4. Send email draft task
-        print("\n4️⃣ Sending email draft task...")
-        email_task = await client.send_task(
-            task_type="email_draft",
-            parameters={
-                "recipient_email": "colleague@company.com",
-                "subject": "Project Update Meeting",
-                "body": "Hi, I'd like to schedule a meeting to discuss the project updates."
-            },
-            priority=5
-        )
-        print(f"   Email Task: {email_task}")
-        
-        # 5. Send contact search task
-        print("\n5️⃣ Sending contact search task...")
-        contact_task = await client.send_task(
-            task_type="contact_search",
-            parameters={"query": "John"},
-            priority=3
-        )
-        print(f"   Contact Task: {contact_task}")
-        
-        # 6. Send template suggestion task
-        print("\n6️⃣ Sending template suggestion task...")
-        template_task = await client.send_task(
-            task_type="template_suggestion",
-            parameters={"context": "introduction"},
-            priority=4
+        # 4-6. Send the email draft, contact search and template suggestion
+        # tasks; they are independent, so their round trips overlap
+        out.append("\n4️⃣ Sending email draft task...")
+        out.append("5️⃣ Sending contact search task...")
+        out.append("6️⃣ Sending template suggestion task...")
+        _write_lines(out)
+        email_task, contact_task, template_task = await asyncio.gather(
+            client.send_task(
+                task_type="email_draft",
+                parameters={
+                    "recipient_email": "colleague@company.com",
+                    "subject": "Project Update Meeting",
+                    "body": "Hi, I'd like to schedule a meeting to discuss the project updates."
+                },
+                priority=5
+            ),
+            client.send_task(
+                task_type="contact_search",
+                parameters={"query": "John"},
+                priority=3
+            ),
+            client.send_task(
+                task_type="template_suggestion",
+                parameters={"context": "introduction"},
+                priority=4
+            )
         )
-        print(f"   Template Task: {template_task}")
+        out.append(f"   Email Task: {email_task}")
+        out.append(f"   Contact Task: {contact_task}")
+        out.append(f"   Template Task: {template_task}")
         
         # 7. Wait a moment for tasks to process
-        print("\n7️⃣ Waiting for tasks to process...")
+        out.append("\n7️⃣ Waiting for tasks to process...")
+        _write_lines(out)
         await asyncio.sleep(2)
         
-        # 8. Check task statuses
-        print("\n8️⃣ Checking task statuses...")
-        tasks = await client.list_tasks()
-        print(f"   Total Tasks: {len(tasks.get('tasks', []))}")
+        # 8-9. Fetch the sent tasks in one bulk lookup, together with recent messages
+        task_ids = [sent["task_id"] for sent in (email_task, contact_task, template_task) if "task_id" in sent]
+        _write_lines(out)
+        tasks, messages = await asyncio.gather(client.get_task_statuses(task_ids), client.list_messages(limit=10))
+        
+        out.append("\n8️⃣ Checking task statuses...")
+        out.append(f"   Total Tasks: {len(tasks.get('tasks', []))}")
         
         for task in tasks.get('tasks', []):
-            print(f"   - Task {task['id'][:8]}: {task['task_type']} - {task['status']}")
+            out.append(f"   - Task {task['id'][:8]}: {task['task_type']} - {task['status']}")
         
-        # 9. List recent messages
-        print("\n9️⃣ Listing recent messages...")
-        messages = await client.list_messages(limit=10)
-        print(f"   Messages: {len(messages.get('messages', []))} found")
+        out.append("\n9️⃣ Listing recent messages...")
+        out.append(f"   Messages: {len(messages.get('messages', []))} found")
         
         # 10. Summary
-        print("\n🎯 Demo Summary:")
-        print("   ✅ ACP server communication established")
-        print("   ✅ Agent registration successful")
-        print("   ✅ Multiple task types processed")
-        print("   ✅ Message history maintained")
-        print("\n💡 Next steps:")
-        print("   - Explore the ACP server API")
-        print("   - Implement more sophisticated agents")
-        print("   - Add streaming and async capabilities")
-        print("   - Integrate with existing MCP tools")
+        out.append("\n🎯 Demo Summary:")
+        out.append("   ✅ ACP server communication established")
+        out.append("   ✅ Agent registration successful")
+        out.append("   ✅ Multiple task types processed")
+        out.append("   ✅ Message history maintained")
+        out.append("\n💡 Next steps:")
+        out.append("   - Explore the ACP server API")
+        out.append("   - Implement more sophisticated agents")
+        out.append("   - Add streaming and async capabilities")
+        out.append("   - Integrate with existing MCP tools")
+        _write_lines(out)
 
 if __name__ == "__main__":
-    # Run the demo
+    # Run the demo on uvloop's libuv event loop (not available on Windows)
+    if sys.platform != "win32":
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(demo_acp_communication())
@@ -4,23 +4,65 @@ Implements the Agent Communication Protocol for agent interoperability
 """
 
 import asyncio
+import itertools
 import json
 import logging
+import os
+import sys
+import time
 import uuid
+from collections import deque
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Union
-from dataclasses import dataclass, asdict
+from typing import Annotated, Any, Awaitable, Callable, Deque, Dict, List, Optional, Union
 from enum import Enum
 
+import orjson
 import uvicorn
-from fastapi import FastAPI, HTTPException, Request, Response
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Discriminator, Field, PrivateAttr, Tag, TypeAdapter, ValidationError
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Timestamps are reused for this many seconds before being reformatted
+ISO_NOW_RESOLUTION = 0.1
+_iso_now_cache = (float("-inf"), "")
+
+def iso_now() -> str:
+    """Current UTC time as an ISO string, cached at ISO_NOW_RESOLUTION granularity"""
+    global _iso_now_cache
+    now = time.time()
+    if now - _iso_now_cache[0] >= ISO_NOW_RESOLUTION:
+        _iso_now_cache = (now, datetime.fromtimestamp(now, timezone.utc).isoformat())
+    return _iso_now_cache[1]
+
+# Number of most recent messages kept in the server's history
+MESSAGE_HISTORY_LIMIT = 10_000
+
+# Number of worker coroutines draining the task queue
+TASK_WORKERS = 4
+
+# Simulated contact database for contact_search tasks
+_CONTACTS = (
+    {"name": "John Doe", "email": "john@example.com", "role": "Developer"},
+    {"name": "Jane Smith", "email": "jane@example.com", "role": "Designer"}
+)
+# (lowercased name, contact) pairs so searches only lowercase the query
+_CONTACTS_LOWER_INDEX = tuple((contact["name"].lower(), contact) for contact in _CONTACTS)
+
+# Simulated templates for template_suggestion tasks
+_TEMPLATES = {
+    "introduction": "Hi [Name], I hope this email finds you well...",
+    "follow_up": "Thank you for our conversation yesterday...",
+    "networking": "I came across your work and was impressed...",
+    "general": "Hello [Name], I'm reaching out because..."
+}
+_TEMPLATE_KEYS = tuple(_TEMPLATES)
+
 # ACP Message Types
 class MessageType(str, Enum):
     TASK = "task"
@@ -42,13 +84,15 @@ class ACPMessage(BaseModel):
     """Base ACP message structure"""
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     type: MessageType
-    timestamp: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    timestamp: str = Field(default_factory=iso_now)
     sender: str
     recipient: Optional[str] = None
     content: Dict[str, Any] = {}
     metadata: Dict[str, Any] = Field(default_factory=dict)
     status: MessageStatus = MessageStatus.PENDING
     error: Optional[str] = None
+    # Encoded JSON of this message, filled in by _encoded()
+    _encoded: Optional[bytes] = PrivateAttr(default=None)
 
 class TaskMessage(ACPMessage):
     """Task message for requesting agent actions"""
@@ -72,6 +116,32 @@ class ErrorMessage(ACPMessage):
     error_code: str
     error_details: str
 
+def _message_kind(value: Any) -> str:
+    """Pick the message model tag for a payload from its type field"""
+    message_type = value.get("type") if isinstance(value, dict) else getattr(value, "type", None)
+    return message_type if message_type in ("task", "response", "error") else "other"
+
+def _body_validation_error(error: ValidationError) -> RequestValidationError:
+    """Report a body validation failure the way FastAPI does for typed bodies"""
+    return RequestValidationError([
+        {**detail, "loc": ("body", *detail["loc"])} for detail in error.errors(include_url=False)
+    ])
+
+# Any ACP message, resolved to its model by the type field
+_AnyMessage = Annotated[
+    Union[
+        Annotated[TaskMessage, Tag("task")],
+        Annotated[ResponseMessage, Tag("response")],
+        Annotated[ErrorMessage, Tag("error")],
+        Annotated[ACPMessage, Tag("other")],
+    ],
+    Discriminator(_message_kind)
+]
+
+# Decode POST /messages and /messages/batch bodies from raw JSON straight into the matching models
+_MESSAGE_ADAPTER = TypeAdapter(_AnyMessage)
+_MESSAGE_BATCH_ADAPTER = TypeAdapter(List[_AnyMessage])
+
 # ACP Agent Manifest
 class AgentManifest(BaseModel):
     """Agent manifest for discovery and capabilities"""
@@ -84,16 +154,72 @@ class AgentManifest(BaseModel):
     supported_formats: List[str] = Field(default_factory=list)
     contact_info: Dict[str, str] = Field(default_factory=dict)
     metadata: Dict[str, Any] = Field(default_factory=dict)
+    # Encoded JSON of this manifest, filled in by _encoded()
+    _encoded: Optional[bytes] = PrivateAttr(default=None)
+
+def _encoded(model: Union[ACPMessage, AgentManifest]) -> bytes:
+    """JSON encoding of a stored model, memoized on it until it changes"""
+    if model._encoded is None:
+        model._encoded = orjson.dumps(model.model_dump(mode="json"))
+    return model._encoded
+
+def _encoded_response(key: str, models) -> Response:
+    """Respond with {key: model} or {key: [models]} from the memoized encodings"""
+    if isinstance(models, BaseModel):
+        body = b"".join((b'{"', key.encode(), b'":', _encoded(models), b"}"))
+    else:
+        body = b"".join((b'{"', key.encode(), b'":[', b",".join(map(_encoded, models)), b"]}"))
+    return Response(content=body, media_type="application/json")
+
+# Models per chunk when streaming a listing as newline-delimited JSON
+NDJSON_CHUNK_ITEMS = 256
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+def _wants_ndjson(request: Request) -> bool:
+    """Whether the client asked for a listing as newline-delimited JSON"""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+def _ndjson_response(models: List[Union[ACPMessage, AgentManifest]]) -> StreamingResponse:
+    """Stream models one JSON document per line, so clients can parse as they receive"""
+    async def chunks():
+        for start in range(0, len(models), NDJSON_CHUNK_ITEMS):
+            batch = models[start:start + NDJSON_CHUNK_ITEMS]
+            yield b"\n".join(map(_encoded, batch)) + b"\n"
+    return StreamingResponse(chunks(), media_type=NDJSON_MEDIA_TYPE)
+
+# Body of GET /, encoded once at import
+_ROOT_BYTES = orjson.dumps({"message": "MESH ACP Server", "version": "1.0.0"})
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
 
 # ACP Server
 class ACPServer:
     """ACP-compliant server for agent communication"""
     
     def __init__(self):
-        self.app = FastAPI(title="MESH ACP Server", version="1.0.0")
+        self.app = FastAPI(title="MESH ACP Server", version="1.0.0", default_response_class=ORJSONResponse,
+                           lifespan=self._lifespan)
         self.agents: Dict[str, AgentManifest] = {}
         self.tasks: Dict[str, TaskMessage] = {}
-        self.message_history: List[ACPMessage] = []
+        # Task ids per status; dicts keep insertion order like an ordered set
+        self._tasks_by_status: Dict[MessageStatus, Dict[str, None]] = {status: {} for status in MessageStatus}
+        self.message_history: Deque[ACPMessage] = deque(maxlen=MESSAGE_HISTORY_LIMIT)
+        self._message_index: Dict[str, ACPMessage] = {}
+        # (timestamp, encoded /health body), re-encoded only when iso_now() ticks
+        self._health_cached = ("", b"")
+        # Submitted tasks wait here for the workers; both are created on the running loop
+        self._task_queue: Optional[asyncio.Queue] = None
+        self._task_workers: List[asyncio.Task] = []
+        # Task handlers keyed by lowercased task_type
+        self._task_handlers: Dict[str, Callable[[TaskMessage], Awaitable[Dict[str, Any]]]] = {
+            "email_draft": self._handle_email_draft_task,
+            "contact_search": self._handle_contact_search_task,
+            "template_suggestion": self._handle_template_suggestion_task
+        }
         
         # Register routes
         self._register_routes()
@@ -103,88 +229,119 @@ class ACPServer:
     def _register_routes(self):
         """Register ACP API routes"""
         
-        @self.app.get("/")
+        @self.app.get("/", response_model=None)
         async def root():
-            return {"message": "MESH ACP Server", "version": "1.0.0"}
+            return Response(content=_ROOT_BYTES, media_type="application/json")
         
-        @self.app.get("/health")
+        @self.app.get("/health", response_model=None)
         async def health():
-            return {"status": "healthy", "timestamp": datetime.now(timezone.utc).isoformat()}
+            timestamp = iso_now()
+            # iso_now() hands back the same string object until it ticks
+            if self._health_cached[0] is not timestamp:
+                self._health_cached = (timestamp, orjson.dumps({"status": "healthy", "timestamp": timestamp}))
+            return Response(content=self._health_cached[1], media_type="application/json")
         
-        @self.app.post("/agents/register")
-        async def register_agent(manifest: AgentManifest):
+        @self.app.post("/agents/register", response_model=None)
+        async def register_agent(request: Request):
             """Register a new agent"""
+            try:
+                manifest = AgentManifest.model_validate_json(await request.body())
+            except ValidationError as e:
+                raise _body_validation_error(e)
+            
             try:
                 self.agents[manifest.id] = manifest
                 logger.info(f"Agent registered: {manifest.name} ({manifest.id})")
-                return {"status": "success", "agent_id": manifest.id}
+                return ORJSONResponse({"status": "success", "agent_id": manifest.id})
             except Exception as e:
                 logger.error(f"Failed to register agent: {e}")
                 raise HTTPException(status_code=500, detail=str(e))
         
-        @self.app.get("/agents")
+        @self.app.get("/agents", response_model=None)
         async def list_agents():
             """List all registered agents"""
-            return {"agents": [asdict(agent) for agent in self.agents.values()]}
+            return _encoded_response("agents", self.agents.values())
         
-        @self.app.get("/agents/{agent_id}")
+        @self.app.get("/agents/{agent_id}", response_model=None)
         async def get_agent(agent_id: str):
             """Get agent details"""
             if agent_id not in self.agents:
                 raise HTTPException(status_code=404, detail="Agent not found")
-            return {"agent": asdict(self.agents[agent_id])}
+            return _encoded_response("agent", self.agents[agent_id])
         
-        @self.app.post("/messages")
-        async def send_message(message: ACPMessage):
+        @self.app.post("/messages", response_model=None)
+        async def send_message(request: Request):
             """Send a message to an agent"""
             try:
-                # Store message
-                self.message_history.append(message)
-                
-                # Handle different message types
-                if message.type == MessageType.TASK:
-                    return await self._handle_task(message)
-                elif message.type == MessageType.RESPONSE:
-                    return await self._handle_response(message)
-                elif message.type == MessageType.ERROR:
-                    return await self._handle_error(message)
-                else:
-                    return {"status": "received", "message_id": message.id}
-                    
+                message = _MESSAGE_ADAPTER.validate_json(await request.body())
+            except ValidationError as e:
+                raise _body_validation_error(e)
+            
+            try:
+                result = await self._accept_message(message)
             except Exception as e:
                 logger.error(f"Failed to process message: {e}")
                 raise HTTPException(status_code=500, detail=str(e))
+            return ORJSONResponse(result, status_code=202 if message.type == MessageType.TASK else 200)
         
-        @self.app.get("/messages")
-        async def list_messages(limit: int = 100, offset: int = 0):
-            """List recent messages"""
-            messages = self.message_history[offset:offset + limit]
-            return {"messages": [asdict(msg) for msg in messages]}
+        @self.app.post("/messages/batch", response_model=None)
+        async def send_message_batch(request: Request):
+            """Send several messages in one request, reporting a result per message"""
+            try:
+                messages = _MESSAGE_BATCH_ADAPTER.validate_json(await request.body())
+            except ValidationError as e:
+                raise _body_validation_error(e)
+            
+            results = []
+            for message in messages:
+                try:
+                    results.append(await self._accept_message(message))
+                except Exception as e:
+                    logger.error(f"Failed to process message: {e}")
+                    results.append({"status": "error", "message_id": message.id, "error": str(e)})
+            return ORJSONResponse({"results": results, "count": len(results)})
+        
+        @self.app.get("/messages", response_model=None)
+        async def list_messages(request: Request, limit: int = Query(100, ge=0), offset: int = Query(0, ge=0)):
+            """List recent messages, as NDJSON when the client accepts it"""
+            messages = itertools.islice(self.message_history, offset, offset + limit)
+            if _wants_ndjson(request):
+                # Snapshot the page; the history may change while the body streams
+                return _ndjson_response(list(messages))
+            return _encoded_response("messages", messages)
         
-        @self.app.get("/messages/{message_id}")
+        @self.app.get("/messages/{message_id}", response_model=None)
         async def get_message(message_id: str):
             """Get message details"""
-            for msg in self.message_history:
-                if msg.id == message_id:
-                    return {"message": asdict(msg)}
-            raise HTTPException(status_code=404, detail="Message not found")
+            msg = self._message_index.get(message_id)
+            if msg is None:
+                raise HTTPException(status_code=404, detail="Message not found")
+            return _encoded_response("message", msg)
         
-        @self.app.get("/tasks")
-        async def list_tasks(status: Optional[MessageStatus] = None):
-            """List tasks with optional status filter"""
-            tasks = self.tasks.values()
-            if status:
-                tasks = [t for t in tasks if t.status == status]
-            return {"tasks": [asdict(task) for task in tasks]}
+        @self.app.get("/tasks", response_model=None)
+        async def list_tasks(request: Request, status: Optional[MessageStatus] = None, ids: Optional[str] = None):
+            """List tasks with optional status and comma-separated ids filters, as NDJSON when the client accepts it"""
+            if ids is not None:
+                # Bulk lookup in the order given; unknown ids are left out
+                tasks = [task for task in map(self.tasks.get, ids.split(",")) if task is not None]
+                if status:
+                    tasks = [task for task in tasks if task.status == status]
+            elif status:
+                tasks = [self.tasks[task_id] for task_id in self._tasks_by_status[status]]
+            else:
+                tasks = self.tasks.values()
+            if _wants_ndjson(request):
+                return _ndjson_response(list(tasks))
+            return _encoded_response("tasks", tasks)
         
-        @self.app.get("/tasks/{task_id}")
+        @self.app.get("/tasks/{task_id}", response_model=None)
         async def get_task(task_id: str):
             """Get task details"""
             if task_id not in self.tasks:
                 raise HTTPException(status_code=404, detail="Task not found")
-            return {"task": asdict(self.tasks[task_id])}
+            return _encoded_response("task", self.tasks[task_id])
         
-        @self.app.delete("/tasks/{task_id}")
+        @self.app.delete("/tasks/{task_id}", response_model=None)
         async def cancel_task(task_id: str):
             """Cancel a running task"""
             if task_id not in self.tasks:
@@ -194,18 +351,99 @@ class ACPServer:
             if task.status in [MessageStatus.COMPLETED, MessageStatus.FAILED]:
                 raise HTTPException(status_code=400, detail="Cannot cancel completed/failed task")
             
-            task.status = MessageStatus.CANCELLED
+            self._set_task_status(task, MessageStatus.CANCELLED)
             logger.info(f"Task cancelled: {task_id}")
-            return {"status": "cancelled", "task_id": task_id}
+            return ORJSONResponse({"status": "cancelled", "task_id": task_id})
+    
+    async def _accept_message(self, message: ACPMessage) -> Dict[str, Any]:
+        """Store an incoming message and hand it to the handler for its type"""
+        self._append_message(message)
+        
+        # Handle different message types
+        if message.type == MessageType.TASK:
+            # Tasks run in the background; clients poll /tasks/{id} for the outcome
+            await self._submit_task(message)
+            return {"status": "accepted", "task_id": message.id}
+        elif message.type == MessageType.RESPONSE:
+            return await self._handle_response(message)
+        elif message.type == MessageType.ERROR:
+            return await self._handle_error(message)
+        else:
+            return {"status": "received", "message_id": message.id}
+    
+    def _append_message(self, message: ACPMessage):
+        """Record a message, evicting the oldest once the history is full"""
+        if len(self.message_history) == self.message_history.maxlen:
+            evicted = self.message_history[0]
+            if self._message_index.get(evicted.id) is evicted:
+                del self._message_index[evicted.id]
+        self.message_history.append(message)
+        self._message_index[message.id] = message
+    
+    def _store_task(self, task: TaskMessage):
+        """Register a task and index it under its current status"""
+        previous = self.tasks.get(task.id)
+        if previous is not None:
+            self._tasks_by_status[previous.status].pop(task.id, None)
+        self.tasks[task.id] = task
+        self._tasks_by_status[task.status][task.id] = None
+    
+    def _set_task_status(self, task: TaskMessage, status: MessageStatus):
+        """Change a task's status and move it in the status index"""
+        self._tasks_by_status[task.status].pop(task.id, None)
+        task.status = status
+        task._encoded = None
+        self._tasks_by_status[status][task.id] = None
+    
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI):
+        """Run the task workers for the lifetime of the app"""
+        self._start_task_workers()
+        yield
+        await self._stop_task_workers()
+    
+    def _start_task_workers(self):
+        """Create the task queue and its workers on the running loop"""
+        if self._task_workers:
+            return
+        self._task_queue = asyncio.Queue()
+        self._task_workers = [asyncio.create_task(self._task_worker()) for _ in range(TASK_WORKERS)]
+    
+    async def _stop_task_workers(self):
+        """Cancel the task workers, dropping any tasks still queued"""
+        for worker in self._task_workers:
+            worker.cancel()
+        await asyncio.gather(*self._task_workers, return_exceptions=True)
+        self._task_workers = []
+        self._task_queue = None
+    
+    async def _submit_task(self, message: TaskMessage):
+        """Record a task as pending and queue it for a worker"""
+        self._store_task(message)
+        self._start_task_workers()
+        await self._task_queue.put(message)
+    
+    async def _task_worker(self):
+        """Process queued tasks one at a time"""
+        while True:
+            message = await self._task_queue.get()
+            try:
+                # Tasks cancelled while queued are skipped
+                if message.status == MessageStatus.PENDING:
+                    await self._handle_task(message)
+            except Exception as e:
+                logger.error(f"Task worker failed on {message.id}: {e}")
+            finally:
+                self._task_queue.task_done()
     
     async def _handle_task(self, message: TaskMessage) -> Dict[str, Any]:
         """Handle incoming task messages"""
         try:
             # Store task
-            self.tasks[message.id] = message
+            self._store_task(message)
             
             # Update status
-            message.status = MessageStatus.RUNNING
+            self._set_task_status(message, MessageStatus.RUNNING)
             
             # Process task based on type
             result = await self._process_task(message)
@@ -219,10 +457,10 @@ class ACPServer:
             )
             
             # Update task status
-            message.status = MessageStatus.COMPLETED
+            self._set_task_status(message, MessageStatus.COMPLETED)
             
             # Store response
-            self.message_history.append(response)
+            self._append_message(response)
             
             logger.info(f"Task completed: {message.id}")
             return {"status": "task_processed", "task_id": message.id, "response_id": response.id}
@@ -238,11 +476,11 @@ class ACPServer:
             )
             
             # Update task status
-            message.status = MessageStatus.FAILED
             message.error = str(e)
+            self._set_task_status(message, MessageStatus.FAILED)
             
             # Store error message
-            self.message_history.append(error_msg)
+            self._append_message(error_msg)
             
             logger.error(f"Task failed: {message.id} - {e}")
             return {"status": "task_failed", "task_id": message.id, "error_id": error_msg.id}
@@ -251,14 +489,14 @@ class ACPServer:
         """Process a task based on its type"""
         task_type = task.task_type.lower()
         
-        if task_type == "email_draft":
-            return await self._handle_email_draft_task(task)
-        elif task_type == "contact_search":
-            return await self._handle_contact_search_task(task)
-        elif task_type == "template_suggestion":
-            return await self._handle_template_suggestion_task(task)
-        else:
+        handler = self._task_handlers.get(task_type)
+        if handler is None:
             raise ValueError(f"Unsupported task type: {task_type}")
+        return await handler(task)
+    
+    def register_task_handler(self, task_type: str, handler: Callable[[TaskMessage], Awaitable[Dict[str, Any]]]):
+        """Add or replace the coroutine that processes tasks of the given type"""
+        self._task_handlers[task_type.lower()] = handler
     
     async def _handle_email_draft_task(self, task: TaskMessage) -> Dict[str, Any]:
         """Handle email draft creation task"""
@@ -273,7 +511,7 @@ class ACPServer:
             "to": recipient,
             "subject": subject,
             "body": body,
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": iso_now(),
             "status": "draft"
         }
         
@@ -290,13 +528,11 @@ class ACPServer:
         
         # Simulate contact search
         # In a real implementation, this would search the actual contact database
-        contacts = [
-            {"name": "John Doe", "email": "john@example.com", "role": "Developer"},
-            {"name": "Jane Smith", "email": "jane@example.com", "role": "Designer"}
-        ]
-        
         if query:
-            contacts = [c for c in contacts if query.lower() in c["name"].lower()]
+            query_lower = query.lower()
+            contacts = [c for name_lower, c in _CONTACTS_LOWER_INDEX if query_lower in name_lower]
+        else:
+            contacts = list(_CONTACTS)
         
         return {
             "task_type": "contact_search",
@@ -311,20 +547,13 @@ class ACPServer:
         context = params.get("context", "general")
         
         # Simulate template suggestions
-        templates = {
-            "introduction": "Hi [Name], I hope this email finds you well...",
-            "follow_up": "Thank you for our conversation yesterday...",
-            "networking": "I came across your work and was impressed...",
-            "general": "Hello [Name], I'm reaching out because..."
-        }
-        
-        template = templates.get(context.lower(), templates["general"])
+        template = _TEMPLATES.get(context.lower(), _TEMPLATES["general"])
         
         return {
             "task_type": "template_suggestion",
             "context": context,
             "template": template,
-            "suggestions": list(templates.keys())
+            "suggestions": _TEMPLATE_KEYS
         }
     
     async def _handle_response(self, message: ResponseMessage) -> Dict[str, Any]:
@@ -337,14 +566,22 @@ class ACPServer:
         logger.error(f"Error message received: {message.error_code} - {message.error_details}")
         return {"status": "error_processed", "message_id": message.id}
     
-    def run(self, host: str = "127.0.0.1", port: int = 8081):
-        """Run the ACP server"""
-        logger.info(f"Starting ACP server on {host}:{port}")
-        uvicorn.run(self.app, host=host, port=port)
+    def run(self, host: str = "127.0.0.1", port: int = 8081, uds: Optional[str] = None):
+        """Run the ACP server, on a Unix domain socket instead of host:port when uds is given"""
+        logger.info(f"Starting ACP server on {uds or f'{host}:{port}'}")
+        # uvloop's libuv event loop and the httptools parser (uvloop is not available on Windows)
+        uvicorn.run(
+            self.app,
+            host=host,
+            port=port,
+            uds=uds,
+            loop="asyncio" if sys.platform == "win32" else "uvloop",
+            http="httptools"
+        )
 
 # Create and configure the ACP server
 acp_server = ACPServer()
 
 if __name__ == "__main__":
-    # Run the ACP server
-    acp_server.run()
+    # Run the ACP server; set ACP_UDS to a socket path to skip TCP for local clients
+    acp_server.run(uds=os.environ.get("ACP_UDS"))
@@ -2,46 +2,363 @@
 MESH Agent Capabilities Definition for A2A Protocol
 """
 
-from typing import Dict, List, Any, Optional
-from pydantic import BaseModel, Field
-from enum import Enum
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Final, FrozenSet, List, Any, Optional, Tuple
 
-class TaskPriority(str, Enum):
+import orjson
+
+# JSON data files shipped alongside this module
+_DATA_DIR = Path(__file__).resolve().parent
+
+class TaskPriority:
     """Task priority levels"""
-    LOW = "low"
-    NORMAL = "normal"
-    HIGH = "high"
-    URGENT = "urgent"
+    LOW: Final = "low"
+    NORMAL: Final = "normal"
+    HIGH: Final = "high"
+    URGENT: Final = "urgent"
+    ALL: Final = frozenset({LOW, NORMAL, HIGH, URGENT})
 
-class TaskStatus(str, Enum):
+class TaskStatus:
     """Task execution status"""
-    PENDING = "pending"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    CANCELLED = "cancelled"
+    PENDING: Final = "pending"
+    IN_PROGRESS: Final = "in_progress"
+    COMPLETED: Final = "completed"
+    FAILED: Final = "failed"
+    CANCELLED: Final = "cancelled"
+    ALL: Final = frozenset({PENDING, IN_PROGRESS, COMPLETED, FAILED, CANCELLED})
 
-class AgentMethod(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AgentMethod:
     """Definition of an agent method"""
     name: str
     description: str
     parameters: Dict[str, Any]
     returns: Dict[str, Any]
     examples: List[Dict[str, Any]]
-    required_capabilities: List[str] = []
+    required_capabilities: List[str] = field(default_factory=list)
+    # Parallel per-parameter columns derived from parameters, for callers that scan fields
+    param_names: Tuple[str, ...] = field(init=False)
+    param_types: Tuple[str, ...] = field(init=False)
+    param_descs: Tuple[str, ...] = field(init=False)
+    param_optional: Tuple[bool, ...] = field(init=False)
+    
+    def __post_init__(self):
+        specs = self.parameters.values()
+        object.__setattr__(self, "param_names", tuple(self.parameters))
+        object.__setattr__(self, "param_types", tuple(spec["type"] for spec in specs))
+        object.__setattr__(self, "param_descs", tuple(spec["description"] for spec in specs))
+        object.__setattr__(self, "param_optional", tuple(spec.get("optional", False) for spec in specs))
 
-class AgentCapability(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AgentCapability:
     """Definition of an agent capability"""
     name: str
     description: str
     methods: List[str]
     data_sources: List[str]
     performance_metrics: Dict[str, Any]
-    limitations: List[str] = []
+    limitations: List[str] = field(default_factory=list)
+
+# Shared JSON-schema skeletons for method parameters and return values
+_STRING = MappingProxyType({"type": "string"})
+_OBJECT = MappingProxyType({"type": "object"})
+_ARRAY = MappingProxyType({"type": "array"})
+_INTEGER = MappingProxyType({"type": "integer"})
+
+def _schema(base: MappingProxyType, description: str, **extra: Any) -> Dict[str, Any]:
+    """Build a field schema from a shared type skeleton"""
+    return {**base, "description": description, **extra}
+
+def _define_methods() -> Dict[str, AgentMethod]:
+    """Define all available methods"""
+    return {
+        "initialize": AgentMethod(
+            name="initialize",
+            description="Initialize the MESH agent and establish connection",
+            parameters={
+                "client_info": _schema(_OBJECT, "Client information"),
+                "capabilities": _schema(_OBJECT, "Client capabilities")
+            },
+            returns={
+                "agent_info": _schema(_OBJECT, "Agent information"),
+                "capabilities": _schema(_OBJECT, "Agent capabilities"),
+                "status": _schema(_STRING, "Initialization status")
+            },
+            examples=[{
+                "input": {"client_info": {"name": "test-client", "version": "1.0.0"}},
+                "output": {"status": "success", "agent_info": {"name": "MESH", "version": "1.0.0"}}
+            }]
+        ),
+        
+        "capabilities": AgentMethod(
+            name="capabilities",
+            description="Get detailed information about MESH agent capabilities",
+            parameters={},
+            returns={
+                "capabilities": _schema(_OBJECT, "Detailed capability information"),
+                "methods": _schema(_ARRAY, "Available methods"),
+                "data_sources": _schema(_ARRAY, "Available data sources")
+            },
+            examples=[{
+                "input": {},
+                "output": {"capabilities": {"email_management": True, "contact_management": True}}
+            }]
+        ),
+        
+        "methods": AgentMethod(
+            name="methods",
+            description="Get detailed information about available methods",
+            parameters={},
+            returns={
+                "methods": _schema(_ARRAY, "Detailed method information")
+            },
+            examples=[{
+                "input": {},
+                "output": {"methods": ["write_email_draft", "get_contact_info", "suggest_email_template"]}
+            }]
+        ),
+        
+        "write_email_draft": AgentMethod(
+            name="write_email_draft",
+            description="Create a professional email draft",
+            parameters={
+                "recipient_email": _schema(_STRING, "Recipient email address"),
+                "subject": _schema(_STRING, "Email subject line"),
+                "body": _schema(_STRING, "Email body content"),
+                "template_type": _schema(_STRING, "Optional template type"),
+                "priority": _schema(_STRING, "Task priority level")
+            },
+            returns={
+                "status": _schema(_STRING, "Operation status"),
+                "draft_id": _schema(_STRING, "Generated draft identifier"),
+                "message": _schema(_STRING, "Status message")
+            },
+            examples=[{
+                "input": {
+                    "recipient_email": "colleague@company.com",
+                    "subject": "Follow-up on Project Discussion",
+                    "body": "Hi [Name],\n\nThank you for the productive discussion..."
+                },
+                "output": {"status": "success", "draft_id": "draft_123", "message": "Email draft created"}
+            }],
+            required_capabilities=["email_management"]
+        ),
+        
+        "get_contact_info": AgentMethod(
+            name="get_contact_info",
+            description="Retrieve contact information from directory",
+            parameters={
+                "name": _schema(_STRING, "Contact name to search for", optional=True),
+                "email": _schema(_STRING, "Contact email to search for", optional=True),
+                "company": _schema(_STRING, "Company name to search for", optional=True),
+                "expertise": _schema(_STRING, "Expertise area to search for", optional=True)
+            },
+            returns={
+                "contacts": _schema(_ARRAY, "Matching contacts"),
+                "count": _schema(_INTEGER, "Number of contacts found"),
+                "search_criteria": _schema(_OBJECT, "Applied search criteria")
+            },
+            examples=[{
+                "input": {"name": "Sarah Chen"},
+                "output": {"contacts": [{"name": "Sarah Chen", "email": "sarah@innovateai.tech"}], "count": 1}
+            }],
+            required_capabilities=["contact_management"]
+        ),
+        
+        "suggest_email_template": AgentMethod(
+            name="suggest_email_template",
+            description="Suggest appropriate email template based on context",
+            parameters={
+                "context": _schema(_STRING, "Email context (introduction, follow-up, networking)"),
+                "recipient_type": _schema(_STRING, "Type of recipient (colleague, client, partner)"),
+                "urgency": _schema(_STRING, "Urgency level (low, normal, high, urgent)")
+            },
+            returns={
+                "suggested_template": _schema(_OBJECT, "Template information"),
+                "context": _schema(_STRING, "Applied context"),
+                "available_templates": _schema(_ARRAY, "All available templates")
+            },
+            examples=[{
+                "input": {"context": "introduction", "recipient_type": "client"},
+                "output": {"suggested_template": {"name": "3-way-intro", "description": "Professional introduction template"}}
+            }],
+            required_capabilities=["email_management"]
+        ),
+        
+        "discover_agents": AgentMethod(
+            name="discover_agents",
+            description="Discover other A2A agents in the network",
+            parameters={
+                "capability_filter": _schema(_STRING, "Filter by specific capability", optional=True),
+                "protocol_version": _schema(_STRING, "Filter by protocol version", optional=True),
+                "max_results": _schema(_INTEGER, "Maximum number of results", optional=True)
+            },
+            returns={
+                "agents": _schema(_ARRAY, "Discovered agents"),
+                "count": _schema(_INTEGER, "Number of agents found"),
+                "discovery_metadata": _schema(_OBJECT, "Discovery process information")
+            },
+            examples=[{
+                "input": {"capability_filter": "email_management"},
+                "output": {"agents": [{"name": "EmailBot", "capabilities": ["email_management"]}], "count": 1}
+            }],
+            required_capabilities=["collaboration"]
+        ),
+        
+        "delegate_task": AgentMethod(
+            name="delegate_task",
+            description="Delegate a task to another A2A agent",
+            parameters={
+                "task_type": _schema(_STRING, "Type of task to delegate"),
+                "target_agent": _schema(_STRING, "Target agent identifier"),
+                "task_data": _schema(_OBJECT, "Task-specific data"),
+                "priority": _schema(_STRING, "Task priority level"),
+                "timeout": _schema(_INTEGER, "Task timeout in seconds")
+            },
+            returns={
+                "delegation_id": _schema(_STRING, "Delegation identifier"),
+                "status": _schema(_STRING, "Delegation status"),
+                "estimated_completion": _schema(_STRING, "Estimated completion time")
+            },
+            examples=[{
+                "input": {
+                    "task_type": "grammar_check",
+                    "target_agent": "GrammarBot",
+                    "task_data": {"text": "Hello world"},
+                    "priority": "normal"
+                },
+                "output": {"delegation_id": "deleg_456", "status": "delegated", "estimated_completion": "5s"}
+            }],
+            required_capabilities=["collaboration"]
+        ),
+        
+        "collaborate": AgentMethod(
+            name="collaborate",
+            description="Initiate collaboration with another A2A agent",
+            parameters={
+                "collaboration_type": _schema(_STRING, "Type of collaboration"),
+                "partner_agent": _schema(_STRING, "Partner agent identifier"),
+                "shared_context": _schema(_OBJECT, "Context to share"),
+                "collaboration_goals": _schema(_ARRAY, "Collaboration objectives")
+            },
+            returns={
+                "collaboration_id": _schema(_STRING, "Collaboration identifier"),
+                "status": _schema(_STRING, "Collaboration status"),
+                "shared_workspace": _schema(_STRING, "Shared workspace identifier")
+            },
+            examples=[{
+                "input": {
+                    "collaboration_type": "email_composition",
+                    "partner_agent": "WritingAssistant",
+                    "shared_context": {"recipient": "client@company.com"},
+                    "collaboration_goals": ["professional_tone", "clear_structure"]
+                },
+                "output": {"collaboration_id": "collab_789", "status": "active", "shared_workspace": "workspace_123"}
+            }],
+            required_capabilities=["collaboration"]
+        )
+    }
+
+def _define_capabilities() -> Dict[str, AgentCapability]:
+    """Define all available capabilities"""
+    return {
+        "email_management": AgentCapability(
+            name="email_management",
+            description="Professional email creation, editing, and management",
+            methods=["write_email_draft", "suggest_email_template"],
+            data_sources=["email-examples/", "prompts/"],
+            performance_metrics={
+                "response_time_ms": 300,
+                "templates_available": 3,
+                "supported_formats": ["text", "markdown"]
+            },
+            limitations=["Currently in test mode", "No actual email sending"]
+        ),
+        
+        "contact_management": AgentCapability(
+            name="contact_management",
+            description="Professional contact directory access and search",
+            methods=["get_contact_info"],
+            data_sources=["directory.csv"],
+            performance_metrics={
+                "response_time_ms": 200,
+                "total_contacts": 50,
+                "search_fields": ["name", "email", "company", "expertise"]
+            },
+            limitations=["Local CSV file only", "No real-time updates"]
+        ),
+        
+        "professional_networking": AgentCapability(
+            name="professional_networking",
+            description="Strategic networking and connection facilitation",
+            methods=["suggest_email_template"],
+            data_sources=["email-examples/", "directory.csv"],
+            performance_metrics={
+                "response_time_ms": 400,
+                "template_types": ["introduction", "follow-up", "networking"],
+                "connection_suggestions": True
+            },
+            limitations=["Template-based suggestions", "No automated outreach"]
+        ),
+        
+        "collaboration": AgentCapability(
+            name="collaboration",
+            description="Multi-agent collaboration and task orchestration",
+            methods=["discover_agents", "delegate_task", "collaborate"],
+            data_sources=["agent_registry", "shared_workspace"],
+            performance_metrics={
+                "response_time_ms": 500,
+                "max_concurrent_collaborations": 10,
+                "agent_discovery_time_ms": 1000
+            },
+            limitations=["Requires A2A network", "Limited to compatible agents"]
+        )
+    }
+
+@cache
+def _define_data_models() -> MappingProxyType:
+    """Define data models for the agent"""
+    return MappingProxyType(orjson.loads((_DATA_DIR / "data_models.json").read_bytes()))
+
+@cache
+def _define_collaboration_patterns() -> MappingProxyType:
+    """Define collaboration patterns with other agents"""
+    return MappingProxyType(orjson.loads((_DATA_DIR / "collaboration_patterns.json").read_bytes()))
+
+# The method and capability tables back every A2A handshake, so they are built
+# once at import; data models and collaboration patterns are built on first use
+_METHODS = MappingProxyType(_define_methods())
+_CAPABILITIES = MappingProxyType(_define_capabilities())
+
+# Pre-encoded JSON for transports that publish the tables verbatim
+_METHODS_JSON = orjson.dumps(dict(_METHODS))
+_CAPABILITIES_JSON = orjson.dumps(dict(_CAPABILITIES))
+
+# Bound lookups for the per-request accessors
+_method_get = _METHODS.get
+_capability_get = _CAPABILITIES.get
+
+# Name listings are immutable, so one tuple and set serve every caller
+_METHOD_NAMES = tuple(_METHODS)
+_METHOD_NAME_SET = frozenset(_METHOD_NAMES)
+_CAPABILITY_NAMES = tuple(_CAPABILITIES)
+_CAPABILITY_NAME_SET = frozenset(_CAPABILITY_NAMES)
+
+# Capabilities each method requires, so dispatch gating is a single lookup
+_METHOD_REQS: Dict[str, FrozenSet[str]] = {
+    name: frozenset(method.required_capabilities) for name, method in _METHODS.items()
+}
+_method_reqs_get = _METHOD_REQS.get
+_NO_REQUIREMENTS: FrozenSet[str] = frozenset()
 
 class MESHAgentCapabilities:
     """Complete capabilities definition for MESH agent"""
     
+    __slots__ = ("agent_info", "methods", "capabilities", "_summary")
+    
     def __init__(self):
         self.agent_info = {
             "name": "MESH",
@@ -53,390 +370,65 @@ class MESHAgentCapabilities:
             "transports": ["STDIO", "HTTP", "WebSocket"]
         }
         
-        self.methods = self._define_methods()
-        self.capabilities = self._define_capabilities()
-        self.data_models = self._define_data_models()
-        self.collaboration_patterns = self._define_collaboration_patterns()
-    
-    def _define_methods(self) -> Dict[str, AgentMethod]:
-        """Define all available methods"""
-        return {
-            "initialize": AgentMethod(
-                name="initialize",
-                description="Initialize the MESH agent and establish connection",
-                parameters={
-                    "client_info": {"type": "object", "description": "Client information"},
-                    "capabilities": {"type": "object", "description": "Client capabilities"}
-                },
-                returns={
-                    "agent_info": {"type": "object", "description": "Agent information"},
-                    "capabilities": {"type": "object", "description": "Agent capabilities"},
-                    "status": {"type": "string", "description": "Initialization status"}
-                },
-                examples=[{
-                    "input": {"client_info": {"name": "test-client", "version": "1.0.0"}},
-                    "output": {"status": "success", "agent_info": {"name": "MESH", "version": "1.0.0"}}
-                }]
-            ),
-            
-            "capabilities": AgentMethod(
-                name="capabilities",
-                description="Get detailed information about MESH agent capabilities",
-                parameters={},
-                returns={
-                    "capabilities": {"type": "object", "description": "Detailed capability information"},
-                    "methods": {"type": "array", "description": "Available methods"},
-                    "data_sources": {"type": "array", "description": "Available data sources"}
-                },
-                examples=[{
-                    "input": {},
-                    "output": {"capabilities": {"email_management": True, "contact_management": True}}
-                }]
-            ),
-            
-            "methods": AgentMethod(
-                name="methods",
-                description="Get detailed information about available methods",
-                parameters={},
-                returns={
-                    "methods": {"type": "array", "description": "Detailed method information"}
-                },
-                examples=[{
-                    "input": {},
-                    "output": {"methods": ["write_email_draft", "get_contact_info", "suggest_email_template"]}
-                }]
-            ),
-            
-            "write_email_draft": AgentMethod(
-                name="write_email_draft",
-                description="Create a professional email draft",
-                parameters={
-                    "recipient_email": {"type": "string", "description": "Recipient email address"},
-                    "subject": {"type": "string", "description": "Email subject line"},
-                    "body": {"type": "string", "description": "Email body content"},
-                    "template_type": {"type": "string", "description": "Optional template type"},
-                    "priority": {"type": "string", "description": "Task priority level"}
-                },
-                returns={
-                    "status": {"type": "string", "description": "Operation status"},
-                    "draft_id": {"type": "string", "description": "Generated draft identifier"},
-                    "message": {"type": "string", "description": "Status message"}
-                },
-                examples=[{
-                    "input": {
-                        "recipient_email": "colleague@company.com",
-                        "subject": "Follow-up on Project Discussion",
-                        "body": "Hi [Name],\n\nThank you for the productive discussion..."
-                    },
-                    "output": {"status": "success", "draft_id": "draft_123", "message": "Email draft created"}
-                }],
-                required_capabilities=["email_management"]
-            ),
-            
-            "get_contact_info": AgentMethod(
-                name="get_contact_info",
-                description="Retrieve contact information from directory",
-                parameters={
-                    "name": {"type": "string", "description": "Contact name to search for", "optional": True},
-                    "email": {"type": "string", "description": "Contact email to search for", "optional": True},
-                    "company": {"type": "string", "description": "Company name to search for", "optional": True},
-                    "expertise": {"type": "string", "description": "Expertise area to search for", "optional": True}
-                },
-                returns={
-                    "contacts": {"type": "array", "description": "Matching contacts"},
-                    "count": {"type": "integer", "description": "Number of contacts found"},
-                    "search_criteria": {"type": "object", "description": "Applied search criteria"}
-                },
-                examples=[{
-                    "input": {"name": "Sarah Chen"},
-                    "output": {"contacts": [{"name": "Sarah Chen", "email": "sarah@innovateai.tech"}], "count": 1}
-                }],
-                required_capabilities=["contact_management"]
-            ),
-            
-            "suggest_email_template": AgentMethod(
-                name="suggest_email_template",
-                description="Suggest appropriate email template based on context",
-                parameters={
-                    "context": {"type": "string", "description": "Email context (introduction, follow-up, networking)"},
-                    "recipient_type": {"type": "string", "description": "Type of recipient (colleague, client, partner)"},
-                    "urgency": {"type": "string", "description": "Urgency level (low, normal, high, urgent)"}
-                },
-                returns={
-                    "suggested_template": {"type": "object", "description": "Template information"},
-                    "context": {"type": "string", "description": "Applied context"},
-                    "available_templates": {"type": "array", "description": "All available templates"}
-                },
-                examples=[{
-                    "input": {"context": "introduction", "recipient_type": "client"},
-                    "output": {"suggested_template": {"name": "3-way-intro", "description": "Professional introduction template"}}
-                }],
-                required_capabilities=["email_management"]
-            ),
-            
-            "discover_agents": AgentMethod(
-                name="discover_agents",
-                description="Discover other A2A agents in the network",
-                parameters={
-                    "capability_filter": {"type": "string", "description": "Filter by specific capability", "optional": True},
-                    "protocol_version": {"type": "string", "description": "Filter by protocol version", "optional": True},
-                    "max_results": {"type": "integer", "description": "Maximum number of results", "optional": True}
-                },
-                returns={
-                    "agents": {"type": "array", "description": "Discovered agents"},
-                    "count": {"type": "integer", "description": "Number of agents found"},
-                    "discovery_metadata": {"type": "object", "description": "Discovery process information"}
-                },
-                examples=[{
-                    "input": {"capability_filter": "email_management"},
-                    "output": {"agents": [{"name": "EmailBot", "capabilities": ["email_management"]}], "count": 1}
-                }],
-                required_capabilities=["collaboration"]
-            ),
-            
-            "delegate_task": AgentMethod(
-                name="delegate_task",
-                description="Delegate a task to another A2A agent",
-                parameters={
-                    "task_type": {"type": "string", "description": "Type of task to delegate"},
-                    "target_agent": {"type": "string", "description": "Target agent identifier"},
-                    "task_data": {"type": "object", "description": "Task-specific data"},
-                    "priority": {"type": "string", "description": "Task priority level"},
-                    "timeout": {"type": "integer", "description": "Task timeout in seconds"}
-                },
-                returns={
-                    "delegation_id": {"type": "string", "description": "Delegation identifier"},
-                    "status": {"type": "string", "description": "Delegation status"},
-                    "estimated_completion": {"type": "string", "description": "Estimated completion time"}
-                },
-                examples=[{
-                    "input": {
-                        "task_type": "grammar_check",
-                        "target_agent": "GrammarBot",
-                        "task_data": {"text": "Hello world"},
-                        "priority": "normal"
-                    },
-                    "output": {"delegation_id": "deleg_456", "status": "delegated", "estimated_completion": "5s"}
-                }],
-                required_capabilities=["collaboration"]
-            ),
-            
-            "collaborate": AgentMethod(
-                name="collaborate",
-                description="Initiate collaboration with another A2A agent",
-                parameters={
-                    "collaboration_type": {"type": "string", "description": "Type of collaboration"},
-                    "partner_agent": {"type": "string", "description": "Partner agent identifier"},
-                    "shared_context": {"type": "object", "description": "Context to share"},
-                    "collaboration_goals": {"type": "array", "description": "Collaboration objectives"}
-                },
-                returns={
-                    "collaboration_id": {"type": "string", "description": "Collaboration identifier"},
-                    "status": {"type": "string", "description": "Collaboration status"},
-                    "shared_workspace": {"type": "string", "description": "Shared workspace identifier"}
-                },
-                examples=[{
-                    "input": {
-                        "collaboration_type": "email_composition",
-                        "partner_agent": "WritingAssistant",
-                        "shared_context": {"recipient": "client@company.com"},
-                        "collaboration_goals": ["professional_tone", "clear_structure"]
-                    },
-                    "output": {"collaboration_id": "collab_789", "status": "active", "shared_workspace": "workspace_123"}
-                }],
-                required_capabilities=["collaboration"]
-            )
-        }
-    
-    def _define_capabilities(self) -> Dict[str, AgentCapability]:
-        """Define all available capabilities"""
-        return {
-            "email_management": AgentCapability(
-                name="email_management",
-                description="Professional email creation, editing, and management",
-                methods=["write_email_draft", "suggest_email_template"],
-                data_sources=["email-examples/", "prompts/"],
-                performance_metrics={
-                    "response_time_ms": 300,
-                    "templates_available": 3,
-                    "supported_formats": ["text", "markdown"]
-                },
-                limitations=["Currently in test mode", "No actual email sending"]
-            ),
-            
-            "contact_management": AgentCapability(
-                name="contact_management",
-                description="Professional contact directory access and search",
-                methods=["get_contact_info"],
-                data_sources=["directory.csv"],
-                performance_metrics={
-                    "response_time_ms": 200,
-                    "total_contacts": 50,
-                    "search_fields": ["name", "email", "company", "expertise"]
-                },
-                limitations=["Local CSV file only", "No real-time updates"]
-            ),
-            
-            "professional_networking": AgentCapability(
-                name="professional_networking",
-                description="Strategic networking and connection facilitation",
-                methods=["suggest_email_template"],
-                data_sources=["email-examples/", "directory.csv"],
-                performance_metrics={
-                    "response_time_ms": 400,
-                    "template_types": ["introduction", "follow-up", "networking"],
-                    "connection_suggestions": True
-                },
-                limitations=["Template-based suggestions", "No automated outreach"]
-            ),
-            
-            "collaboration": AgentCapability(
-                name="collaboration",
-                description="Multi-agent collaboration and task orchestration",
-                methods=["discover_agents", "delegate_task", "collaborate"],
-                data_sources=["agent_registry", "shared_workspace"],
-                performance_metrics={
-                    "response_time_ms": 500,
-                    "max_concurrent_collaborations": 10,
-                    "agent_discovery_time_ms": 1000
-                },
-                limitations=["Requires A2A network", "Limited to compatible agents"]
-            )
-        }
+        self.methods = _METHODS
+        self.capabilities = _CAPABILITIES
+        self._summary = MappingProxyType({
+            "agent_info": self.agent_info,
+            "methods_count": len(_METHODS),
+            "capabilities_count": len(_CAPABILITIES),
+            "supported_protocols": self.agent_info["protocols"],
+            "supported_transports": self.agent_info["transports"]
+        })
     
-    def _define_data_models(self) -> Dict[str, Any]:
-        """Define data models for the agent"""
-        return {
-            "email_draft": {
-                "recipient_email": "string",
-                "subject": "string", 
-                "body": "string",
-                "template_type": "string (optional)",
-                "priority": "string (low|normal|high|urgent)",
-                "created_at": "datetime",
-                "status": "string (draft|ready|sent)"
-            },
-            "contact": {
-                "name": "string",
-                "email": "string",
-                "url": "string",
-                "bio": "string",
-                "company": "string (derived)",
-                "expertise": "string (derived)"
-            },
-            "email_template": {
-                "name": "string",
-                "description": "string",
-                "context": "string",
-                "content": "string",
-                "variables": "array of strings",
-                "best_for": "string"
-            },
-            "agent_info": {
-                "name": "string",
-                "version": "string",
-                "description": "string",
-                "capabilities": "array of strings",
-                "protocols": "array of strings",
-                "endpoint": "string"
-            },
-            "task_delegation": {
-                "delegation_id": "string",
-                "task_type": "string",
-                "target_agent": "string",
-                "task_data": "object",
-                "priority": "string",
-                "status": "string",
-                "created_at": "datetime",
-                "estimated_completion": "datetime"
-            }
-        }
+    @property
+    def data_models(self) -> MappingProxyType:
+        """Data models used by the agent"""
+        return _define_data_models()
     
-    def _define_collaboration_patterns(self) -> Dict[str, Any]:
-        """Define collaboration patterns with other agents"""
-        return {
-            "email_composition": {
-                "description": "Collaborate with writing and grammar agents for enhanced email quality",
-                "workflow": [
-                    "MESH creates initial draft",
-                    "Writing agent improves structure and clarity",
-                    "Grammar agent checks language and style",
-                    "MESH finalizes and formats"
-                ],
-                "benefits": ["Higher quality emails", "Professional tone", "Error-free content"],
-                "required_agents": ["WritingAssistant", "GrammarBot"]
-            },
-            "contact_intelligence": {
-                "description": "Collaborate with CRM and social media agents for enhanced contact insights",
-                "workflow": [
-                    "MESH provides contact basics",
-                    "CRM agent adds business context",
-                    "Social media agent adds recent updates",
-                    "MESH synthesizes comprehensive profile"
-                ],
-                "benefits": ["Richer contact profiles", "Recent updates", "Business context"],
-                "required_agents": ["CRMConnector", "SocialMediaBot"]
-            },
-            "network_analysis": {
-                "description": "Collaborate with graph analysis agents for strategic networking insights",
-                "workflow": [
-                    "MESH provides contact network",
-                    "Graph agent analyzes connections",
-                    "Opportunity agent identifies gaps",
-                    "MESH suggests strategic introductions"
-                ],
-                "benefits": ["Strategic insights", "Opportunity identification", "Network optimization"],
-                "required_agents": ["GraphAnalyzer", "OpportunityFinder"]
-            }
-        }
+    @property
+    def collaboration_patterns(self) -> MappingProxyType:
+        """Collaboration patterns with other agents"""
+        return _define_collaboration_patterns()
     
     def get_method_info(self, method_name: str) -> Optional[AgentMethod]:
         """Get information about a specific method"""
-        return self.methods.get(method_name)
+        return _method_get(method_name)
     
     def get_capability_info(self, capability_name: str) -> Optional[AgentCapability]:
         """Get information about a specific capability"""
-        return self.capabilities.get(capability_name)
+        return _capability_get(capability_name)
     
-    def list_methods(self) -> List[str]:
-        """List all available method names"""
-        return list(self.methods.keys())
+    def get_methods_json_bytes(self) -> bytes:
+        """Get the methods table as pre-encoded JSON"""
+        return _METHODS_JSON
     
-    def list_capabilities(self) -> List[str]:
-        """List all available capability names"""
-        return list(self.capabilities.keys())
+    def get_capabilities_json_bytes(self) -> bytes:
+        """Get the capabilities table as pre-encoded JSON"""
+        return _CAPABILITIES_JSON
     
-    def get_agent_summary(self) -> Dict[str, Any]:
-        """Get a summary of the agent's capabilities"""
-        return {
-            "agent_info": self.agent_info,
-            "methods_count": len(self.methods),
-            "capabilities_count": len(self.capabilities),
-            "supported_protocols": self.agent_info["protocols"],
-            "supported_transports": self.agent_info["transports"]
-        }
-
-# Global instance
-mesh_capabilities = MESHAgentCapabilities()
-
-if __name__ == "__main__":
-    print("MESH Agent Capabilities")
-    print("=" * 30)
+    def list_methods(self) -> Tuple[str, ...]:
+        """List all available method names (shared tuple, do not mutate)"""
+        return _METHOD_NAMES
+    
+    def list_capabilities(self) -> Tuple[str, ...]:
+        """List all available capability names (shared tuple, do not mutate)"""
+        return _CAPABILITY_NAMES
+    
+    def has_method(self, method_name: str) -> bool:
+        """Check whether a method is available"""
+        return method_name in _METHOD_NAME_SET
     
-    # Display agent summary
-    summary = mesh_capabilities.get_agent_summary()
-    print(f"Agent: {summary['agent_info']['name']} v{summary['agent_info']['version']}")
-    print(f"Methods: {summary['methods_count']}")
-    print(f"Capabilities: {summary['capabilities_count']}")
-    print(f"Protocols: {', '.join(summary['supported_protocols'])}")
-    print(f"Transports: {', '.join(summary['supported_transports'])}")
+    def has_capability(self, capability_name: str) -> bool:
+        """Check whether a capability is available"""
+        return capability_name in _CAPABILITY_NAME_SET
     
-    print("\nAvailable Methods:")
-    for method_name in mesh_capabilities.list_methods():
-        method = mesh_capabilities.get_method_info(method_name)
-        print(f"  - {method_name}: {method.description}")
+    def required_capabilities_for(self, method_name: str) -> FrozenSet[str]:
+        """Get the capabilities a method requires (empty for unknown methods)"""
+        return _method_reqs_get(method_name, _NO_REQUIREMENTS)
     
-    print("\nAvailable Capabilities:")
-    for cap_name in mesh_capabilities.list_capabilities():
-        cap = mesh_capabilities.get_capability_info(cap_name)
-        print(f"  - {cap_name}: {cap.description}")
+    def get_agent_summary(self) -> MappingProxyType:
+        """Get a summary of the agent's capabilities (shared, read-only)"""
+        return self._summary
+
+# Global instance
+mesh_capabilities = MESHAgentCapabilities()
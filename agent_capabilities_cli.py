@@ -0,0 +1,31 @@
+"""
+Command-line summary of the MESH agent capabilities
+"""
+
+from agent_capabilities import mesh_capabilities
+
+def main():
+    """Print the agent summary, methods and capabilities"""
+    print("MESH Agent Capabilities")
+    print("=" * 30)
+    
+    # Display agent summary
+    summary = mesh_capabilities.get_agent_summary()
+    print(f"Agent: {summary['agent_info']['name']} v{summary['agent_info']['version']}")
+    print(f"Methods: {summary['methods_count']}")
+    print(f"Capabilities: {summary['capabilities_count']}")
+    print(f"Protocols: {', '.join(summary['supported_protocols'])}")
+    print(f"Transports: {', '.join(summary['supported_transports'])}")
+    
+    print("\nAvailable Methods:")
+    for method_name in mesh_capabilities.list_methods():
+        method = mesh_capabilities.get_method_info(method_name)
+        print(f"  - {method_name}: {method.description}")
+    
+    print("\nAvailable Capabilities:")
+    for cap_name in mesh_capabilities.list_capabilities():
+        cap = mesh_capabilities.get_capability_info(cap_name)
+        print(f"  - {cap_name}: {cap.description}")
+
+if __name__ == "__main__":
+    main()
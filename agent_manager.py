@@ -14,7 +14,7 @@ from enum import Enum
 import httpx
 import websockets
 
-from a2a_config import default_server_config
+from a2a_config import get_server_config
 from agent_capabilities import mesh_capabilities
 
 # Configure logging
@@ -70,9 +70,9 @@ class AgentManager:
         self.discovered_agents: Dict[str, AgentInfo] = {}
         self.registered_agents: Set[str] = set()
         self.task_delegations: Dict[str, TaskDelegation] = {}
-        self.agent_registry_url = default_server_config.registry_url
-        self.heartbeat_interval = default_server_config.heartbeat_interval
-        self.discovery_enabled = default_server_config.discovery_enabled
+        self.agent_registry_url = get_server_config().registry_url
+        self.heartbeat_interval = get_server_config().heartbeat_interval
+        self.discovery_enabled = get_server_config().discovery_enabled
         
         # Performance tracking
         self.agent_response_times: Dict[str, List[int]] = {}
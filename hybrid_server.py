@@ -14,7 +14,7 @@ import socket
 import os
 
 from mcp.server.fastmcp import FastMCP
-from a2a_config import default_server_config
+from a2a_config import get_server_config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -286,14 +286,14 @@ class HybridServer:
             logger.info("Starting A2A server in subprocess...")
             
             # Check if port is available, try alternative ports if needed
-            port = default_server_config.port
+            port = get_server_config().port
             max_port_attempts = 5
             
             for attempt in range(max_port_attempts):
                 try:
                     # Test if port is available
                     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                        s.bind((default_server_config.host, port))
+                        s.bind((get_server_config().host, port))
                         s.close()
                     break
                 except OSError:
@@ -383,7 +383,7 @@ def main():
         # Start A2A server in subprocess
         if hybrid_server.start_a2a_server():
             print("✅ A2A server started successfully")
-            print(f"   Available at: http://{default_server_config.host}:{default_server_config.port}")
+            print(f"   Available at: http://{get_server_config().host}:{get_server_config().port}")
         else:
             print("⚠️ A2A server failed to start, continuing with MCP only")
         
@@ -118,6 +118,8 @@ check_project_structure() {
         "task_orchestrator.py"
         "a2a_config.py"
         "agent_capabilities.py"
+        "data_models.json"
+        "collaboration_patterns.json"
         "acp_server.py"
         "acp_client.py"
         "test-acp-functions.py"
@@ -388,40 +390,42 @@ start_all_servers() {
     stop_servers
 }
 
+# Function to probe one HTTP server's health and info endpoints
+probe_server() {
+    local name=$1
+    local base_url="http://127.0.0.1:$2"
+    local server_info
+    
+    print_status "Testing $name server health..."
+    # One curl call fetches /health then / over the same keep-alive connection
+    if server_info=$(curl -s --max-time 2 -o /dev/null "$base_url/health" "$base_url/" 2>/dev/null); then
+        print_success "$name server is responding"
+        
+        # Show server info
+        if [ -n "$server_info" ]; then
+            print_status "Server info: $server_info"
+        fi
+    else
+        print_warning "$name server is not responding"
+    fi
+}
+
 # Function to show server status
 show_server_status() {
     print_status "Checking server status..."
     
-    # Check if A2A server is responding
+    # Check if A2A and ACP servers are responding, probing both at once
     if command_exists curl; then
-        print_status "Testing A2A server health..."
-        if curl -s http://127.0.0.1:8080/health > /dev/null 2>&1; then
-            print_success "A2A server is responding"
-            
-            # Get server info
-            server_info=$(curl -s http://127.0.0.1:8080/ 2>/dev/null)
-            if [ $? -eq 0 ]; then
-                print_status "Server info: $server_info"
-            fi
-        else
-            print_warning "A2A server is not responding"
-        fi
-    fi
-    
-    # Check if ACP server is responding
-    if command_exists curl; then
-        print_status "Testing ACP server health..."
-        if curl -s http://127.0.0.1:8081/health > /dev/null 2>&1; then
-            print_success "ACP server is responding"
-            
-            # Get server info
-            server_info=$(curl -s http://127.0.0.1:8081/ 2>/dev/null)
-            if [ $? -eq 0 ]; then
-                print_status "Server info: $server_info"
-            fi
-        else
-            print_warning "ACP server is not responding"
-        fi
+        local a2a_report acp_report a2a_probe_pid acp_probe_pid
+        a2a_report=$(mktemp)
+        acp_report=$(mktemp)
+        probe_server "A2A" 8080 > "$a2a_report" &
+        a2a_probe_pid=$!
+        probe_server "ACP" 8081 > "$acp_report" &
+        acp_probe_pid=$!
+        wait $a2a_probe_pid $acp_probe_pid
+        cat "$a2a_report" "$acp_report"
+        rm -f "$a2a_report" "$acp_report"
     fi
     
     # Check if MCP server is running